@@ -1,76 +1,193 @@
+import asyncio
+import csv
+import functools
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import httpx
 import pandas as pd
-import time
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import os
 import random
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    json_loads = json.loads
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to the pandas parser
+    pa = None
+    pa_csv = None
+
 # === CONFIG ===
 CONFIG = {
     "input_comments": "b.i.w.a.k_20250701_075347_comments.csv",
     "input_joins": "b.i.w.a.k_20250701_075347_joins.csv",
     "output_file": "users_videos.csv",
+    "cache_file": "users_videos.cache.json",
+    "cache_save_every": 10,
     "min_interactions": 2,
     "max_users": 100,
     "videos_per_user": 20,
     "delay_between_users": (2, 5),
     "scroll_pause": 1,
-    "max_scrolls": 10
+    "page_load_timeout": 10,
+    "max_scrolls": 10,
+    "max_concurrent_browsers": 5,
+    "max_concurrent_requests": 20,
+    "request_timeout": 15
 }
 
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36")
+
+# Selectors for the Selenium fallback, built once instead of inside the scroll loop
+VIDEO_LINK_XPATH = '//a[contains(@href, "/video/")]'
+VIDEO_HREFS_SCRIPT = "return Array.from(document.querySelectorAll('a[href*=\"/video/\"]'), a => a.href);"
+VIDEO_LINK_COUNT_SCRIPT = "return document.querySelectorAll('a[href*=\"/video/\"]').length;"
+
+# Profile pages embed their initial state as JSON in one of these script tags;
+# the tags are matched on the raw response bytes to skip a decode pass
+HYDRATION_SCRIPT_RE = re.compile(
+    rb'<script id="(?:__UNIVERSAL_DATA_FOR_REHYDRATION__|SIGI_STATE)"[^>]*>(.*?)</script>',
+    re.DOTALL
+)
+
+# undetected_chromedriver patches the chromedriver binary when it launches,
+# so browser start-up must not race between worker threads
+_driver_launch_lock = threading.Lock()
+
+
+USER_COLUMNS = ["user_id", "nickname"]
+
+
+def read_user_columns(path):
+    """Read the user_id and nickname columns of an event CSV as strings."""
+    if pa_csv is not None:
+        convert_options = pa_csv.ConvertOptions(
+            include_columns=USER_COLUMNS,
+            column_types={column: pa.string() for column in USER_COLUMNS},
+            strings_can_be_null=True
+        )
+        return pa_csv.read_csv(path, convert_options=convert_options).to_pandas().astype("string")
+    return pd.read_csv(path, usecols=USER_COLUMNS, dtype={column: "string" for column in USER_COLUMNS})
+
 
 def load_users_from_csv(comments_path, joins_path, min_interactions=1):
     """Load and deduplicate users from comments and joins CSV files."""
-    comments = pd.read_csv(comments_path)
-    joins = pd.read_csv(joins_path)
+    comments = read_user_columns(comments_path)
+    joins = read_user_columns(joins_path)
 
-    comments["interaction_type"] = "comment"
-    joins["interaction_type"] = "join"
+    all_users = pd.concat([comments, joins], ignore_index=True)
 
-    comments = comments[["user_id", "nickname", "interaction_type"]]
-    joins = joins[["user_id", "nickname", "interaction_type"]]
+    # Every comment or join row counts as one interaction
+    counts = all_users["user_id"].value_counts(sort=False).rename_axis("user_id").rename("interaction_type")
+    counts = counts[counts >= min_interactions].sort_index()
+    nicknames = (all_users.dropna(subset=["nickname"])
+                 .drop_duplicates("user_id")
+                 .set_index("user_id")["nickname"])
 
-    all_users = pd.concat([comments, joins])
-    user_counts = all_users.groupby("user_id").agg({
-        "nickname": "first",
-        "interaction_type": "count"
-    }).reset_index()
+    filtered = counts.to_frame().join(nicknames).reset_index()
+    return filtered[["user_id", "nickname", "interaction_type"]]
 
-    filtered = user_counts[user_counts["interaction_type"] >= min_interactions]
-    return filtered
 
+def load_cache(path, today):
+    """Load cached video links, keeping only entries scraped today."""
+    try:
+        with open(path, "rb") as f:
+            cache = json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    suffix = f":{today}"
+    return {key: urls for key, urls in cache.items() if key.endswith(suffix)}
 
-def get_recent_tiktok_posts(username, max_posts=20, scroll_pause=1, max_scrolls=10):
-    url = f"https://www.tiktok.com/@{username.lstrip('@')}"
+
+def save_cache(cache, path):
+    """Write the cache to a temporary file and swap it in so a crash can't truncate it."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, path)
+
+
+def create_driver():
     options = uc.ChromeOptions()
     # Open visible browser
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
+    # Only the /video/ anchors are needed, so skip thumbnails and other
+    # heavy page resources
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2
+    })
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-gpu")
 
-    driver = uc.Chrome(options=options)
+    with _driver_launch_lock:
+        driver = uc.Chrome(options=options)
     driver.set_window_size(1280, 800)
+    return driver
+
+
+def quit_driver(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+def relaunch_driver(driver):
+    """Replace a browser that failed mid-scrape so its pool slot stays usable."""
+    quit_driver(driver)
+    return create_driver()
+
+
+def get_recent_tiktok_posts(driver, username, max_posts=20, scroll_pause=1, max_scrolls=10,
+                            load_timeout=10):
+    url = f"https://www.tiktok.com/@{username.lstrip('@')}"
 
     try:
+        driver.delete_all_cookies()
         driver.get(url)
-        time.sleep(3)
+        # Continue as soon as the first video link renders instead of a fixed sleep
+        WebDriverWait(driver, load_timeout).until(
+            EC.presence_of_element_located((By.XPATH, VIDEO_LINK_XPATH))
+        )
 
         video_urls = set()
         scrolls = 0
         last_height = driver.execute_script("return document.body.scrollHeight")
 
         while len(video_urls) < max_posts and scrolls < max_scrolls:
-            links = driver.find_elements(By.XPATH, '//a[contains(@href, "/video/")]')
-            for link in links:
-                href = link.get_attribute("href")
-                if "/video/" in href:
-                    video_urls.add(href)
-                    if len(video_urls) >= max_posts:
-                        break
+            # Collect every href in one script call rather than a round-trip per element
+            hrefs = driver.execute_script(VIDEO_HREFS_SCRIPT)
+            video_urls.update(hrefs)
+            if len(video_urls) >= max_posts:
+                break
 
+            seen_links = len(hrefs)
             driver.find_element(By.TAG_NAME, "body").send_keys(Keys.END)
-            time.sleep(scroll_pause)
+            # Wait for the next batch of links, but no longer than scroll_pause
+            try:
+                WebDriverWait(driver, scroll_pause).until(
+                    lambda d: d.execute_script(VIDEO_LINK_COUNT_SCRIPT) > seen_links
+                )
+            except TimeoutException:
+                pass
             scrolls += 1
             new_height = driver.execute_script("return document.body.scrollHeight")
             if new_height == last_height:
@@ -83,41 +200,202 @@ def get_recent_tiktok_posts(username, max_posts=20, scroll_pause=1, max_scrolls=
         print(f"[ERROR] Failed for @{username}: {e}")
         return []
 
+
+def extract_video_ids(state):
+    """Return the post ids listed in a profile page's hydration state."""
+    # SIGI_STATE layout
+    post_ids = state.get("ItemList", {}).get("user-post", {}).get("list")
+    if post_ids:
+        return list(post_ids)
+    if state.get("ItemModule"):
+        return list(state["ItemModule"])
+
+    # __UNIVERSAL_DATA_FOR_REHYDRATION__ layout
+    user_detail = state.get("__DEFAULT_SCOPE__", {}).get("webapp.user-detail", {})
+    return [item["id"] for item in user_detail.get("itemList") or [] if "id" in item]
+
+
+async def fetch_user_posts(http_client, username, max_posts=20):
+    """Read a user's recent video URLs from the profile's embedded JSON, without a browser."""
+    handle = username.lstrip('@')
+    response = await http_client.get(f"https://www.tiktok.com/@{handle}")
+    response.raise_for_status()
+
+    for blob in HYDRATION_SCRIPT_RE.findall(response.content):
+        try:
+            video_ids = extract_video_ids(json_loads(blob))
+        except (ValueError, AttributeError):
+            continue
+        if video_ids:
+            return [f"https://www.tiktok.com/@{handle}/video/{video_id}" for video_id in video_ids[:max_posts]]
+    return []
+
+
+class DriverPool:
+    """Browsers for the Selenium fallback, launched on first use and reused across users."""
+
+    def __init__(self, executor, size):
+        self.executor = executor
+        self.size = size
+        self.launched = 0
+        self.idle = asyncio.Queue()
+
+    async def acquire(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            if self.idle.empty() and self.launched < self.size:
+                self.launched += 1
+                try:
+                    return await loop.run_in_executor(self.executor, create_driver)
+                except Exception:
+                    self.launched -= 1
+                    raise
+            driver = await self.idle.get()
+            if driver is not None:
+                return driver
+            # A discarded slot: go round and launch a replacement
+
+    def release(self, driver):
+        self.idle.put_nowait(driver)
+
+    def discard(self):
+        """Give up the slot of a browser that died, waking a waiting user to launch a new one."""
+        self.launched -= 1
+        self.idle.put_nowait(None)
+
+    async def close(self):
+        loop = asyncio.get_running_loop()
+        while not self.idle.empty():
+            driver = self.idle.get_nowait()
+            if driver is not None:
+                await loop.run_in_executor(self.executor, quit_driver, driver)
+
+
+async def scrape_with_browser(driver_pool, user_id):
+    loop = asyncio.get_running_loop()
+    driver = await driver_pool.acquire()
+    try:
+        return await loop.run_in_executor(
+            driver_pool.executor,
+            functools.partial(get_recent_tiktok_posts, driver, user_id,
+                              max_posts=CONFIG["videos_per_user"],
+                              scroll_pause=CONFIG["scroll_pause"],
+                              max_scrolls=CONFIG["max_scrolls"],
+                              load_timeout=CONFIG["page_load_timeout"]))
+    except Exception:
+        try:
+            driver = await loop.run_in_executor(driver_pool.executor, relaunch_driver, driver)
+        except Exception:
+            # The old browser is already quit; free its slot rather than pool a dead driver
+            driver = None
+            driver_pool.discard()
+        raise
     finally:
-        time.sleep(2)
-        driver.quit()
+        if driver is not None:
+            driver_pool.release(driver)
+
+
+async def scrape_user(request_slots, http_client, driver_pool, cache, today, position, total, user_id):
+    """Scrape one user's posts from the profile JSON, falling back to a browser."""
+    cached_urls = cache.get(f"{user_id}:{today}")
+    if cached_urls is not None:
+        print(f"[{position}/{total}] Using cached posts for {user_id}")
+        return user_id, cached_urls
+
+    async with request_slots:
+        print(f"[{position}/{total}] Scraping posts for {user_id}...")
+        video_urls = []
+        try:
+            video_urls = await fetch_user_posts(http_client, user_id, max_posts=CONFIG["videos_per_user"])
+        except httpx.HTTPError as e:
+            print(f"[WARN] Profile JSON unavailable for {user_id}: {e}")
+        except Exception as e:
+            # An unexpected page layout only costs this user the fast path
+            print(f"[WARN] Could not read profile JSON for {user_id}: {e}")
 
+        if not video_urls:
+            try:
+                video_urls = await scrape_with_browser(driver_pool, user_id)
+            except Exception as e:
+                print(f"[WARN] Skipped {user_id} due to error: {e}")
+        # Politeness delay is taken inside the slot so each worker still
+        # pauses between users without serializing the whole run
+        await asyncio.sleep(random.uniform(*CONFIG["delay_between_users"]))
+        return user_id, video_urls
 
-def main():
+
+def write_user_links(writer, csv_file, txt_file, user_id, video_urls):
+    for url in video_urls:
+        writer.writerow([user_id, url])
+        txt_file.write(f"{url}\n")
+    csv_file.flush()
+    txt_file.flush()
+
+
+async def main():
     users_df = load_users_from_csv(CONFIG["input_comments"], CONFIG["input_joins"], CONFIG["min_interactions"])
     users_df = users_df.head(CONFIG["max_users"])
 
-    output_rows = []
+    total = len(users_df)
+    browsers = max(1, min(CONFIG["max_concurrent_browsers"], total))
+    request_slots = asyncio.Semaphore(CONFIG["max_concurrent_requests"])
 
-    for idx, row in users_df.iterrows():
-        user_id = row["user_id"]
-        print(f"[{idx+1}/{len(users_df)}] Scraping posts for {user_id}...")
-        try:
-            video_urls = get_recent_tiktok_posts(user_id, max_posts=CONFIG["videos_per_user"],
-                                                 scroll_pause=CONFIG["scroll_pause"],
-                                                 max_scrolls=CONFIG["max_scrolls"])
-            for url in video_urls:
-                output_rows.append({"user_id": user_id, "video_url": url})
-        except Exception as e:
-            print(f"[WARN] Skipped {user_id} due to error: {e}")
-        time.sleep(random.uniform(*CONFIG["delay_between_users"]))
+    # Users already scraped today are served from the cache instead of
+    # fetching their profile again
+    today = date.today().isoformat()
+    cache = load_cache(CONFIG["cache_file"], today)
+    unsaved = 0
+
+    loop = asyncio.get_running_loop()
+    link_count = 0
+    with ThreadPoolExecutor(max_workers=browsers) as executor, \
+            open(CONFIG["output_file"], "w", newline="", encoding="utf-8") as csv_file, \
+            open("video_urls.txt", "w") as txt_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["user_id", "video_url"])
+
+        # Browsers are only started for users whose profile JSON can't be
+        # parsed, and are then handed out per user instead of paying Chrome
+        # start-up for every profile
+        driver_pool = DriverPool(executor, browsers)
 
-    out_df = pd.DataFrame(output_rows)
-    out_df.to_csv(CONFIG["output_file"], index=False)
-    print(f"\n✅ Done. Saved {len(out_df)} video links to {CONFIG['output_file']}")
+        async with httpx.AsyncClient(headers={"User-Agent": USER_AGENT}, follow_redirects=True,
+                                     timeout=CONFIG["request_timeout"]) as http_client:
+            tasks = [
+                asyncio.create_task(scrape_user(request_slots, http_client, driver_pool, cache, today,
+                                                position, total, user_id))
+                for position, user_id in enumerate(users_df["user_id"], start=1)
+            ]
+            try:
+                # Persist each user's links as soon as they arrive (CSV plus a
+                # plain list with one URL per line) so an interrupted run keeps
+                # its progress. The writes run in a worker thread so the other
+                # scrapes keep going while a user's links hit the disk
+                for next_result in asyncio.as_completed(tasks):
+                    user_id, video_urls = await next_result
+                    await loop.run_in_executor(None, write_user_links, writer, csv_file, txt_file,
+                                               user_id, video_urls)
+                    link_count += len(video_urls)
 
-    # Save plain list of video URLs (one per line)
-    with open("video_urls.txt", "w") as f:
-        for row in output_rows:
-            f.write(f"{row['video_url']}\n")
+                    # Empty results are not cached so failed users are retried
+                    key = f"{user_id}:{today}"
+                    if video_urls and key not in cache:
+                        cache[key] = video_urls
+                        unsaved += 1
+                        if unsaved >= CONFIG["cache_save_every"]:
+                            save_cache(cache, CONFIG["cache_file"])
+                            unsaved = 0
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await driver_pool.close()
+                if unsaved:
+                    save_cache(cache, CONFIG["cache_file"])
 
+    print(f"\n✅ Done. Saved {link_count} video links to {CONFIG['output_file']}")
     print(f"📄 Saved plain video URL list to video_urls.txt")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
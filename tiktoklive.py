@@ -1,6 +1,7 @@
 import asyncio
 import csv
 import os
+import time
 from datetime import datetime
 
 from TikTokLive.client.client import TikTokLiveClient
@@ -13,6 +14,11 @@ from TikTokLive.events.proto_events import JoinEvent
 STREAMER_USERNAME = "@user"  # Change this to the desired streamer
 SESSION_ID = ""  # Your session ID for age-restricted streams
 TT_TARGET_IDC = "us-eastred"  # Data center for your session
+OUTPUT_FORMAT = "csv"  # Event log format: "csv" or "parquet" (requires pyarrow)
+
+if OUTPUT_FORMAT == "parquet":
+    import pyarrow as pa
+    import pyarrow.parquet as pq
 
 # Set environment variable to whitelist the sign server (required for session ID)
 if SESSION_ID:
@@ -37,34 +43,129 @@ username = STREAMER_USERNAME.replace("@", "")
 # Ensure recordings directory exists
 os.makedirs("recordings", exist_ok=True)
 
-comments_csv = f"recordings/{username}_{timestamp}_comments.csv"
-gifts_csv = f"recordings/{username}_{timestamp}_gifts.csv"
-follows_csv = f"recordings/{username}_{timestamp}_follows.csv"
-shares_csv = f"recordings/{username}_{timestamp}_shares.csv"
-joins_csv = f"recordings/{username}_{timestamp}_joins.csv"
-
-# Initialize CSV files with headers
-with open(comments_csv, 'w', newline='', encoding='utf-8') as f:
-    writer = csv.writer(f)
-    writer.writerow(['timestamp', 'user_id', 'nickname', 'comment', 'follower_count'])
-
-with open(gifts_csv, 'w', newline='', encoding='utf-8') as f:
-    writer = csv.writer(f)
-    writer.writerow(['timestamp', 'user_id', 'nickname', 'gift_name', 'repeat_count', 'streakable', 'streaking'])
-
-with open(follows_csv, 'w', newline='', encoding='utf-8') as f:
-    writer = csv.writer(f)
-    writer.writerow(['timestamp', 'user_id', 'nickname', 'follow_count', 'share_type', 'action'])
-
-with open(shares_csv, 'w', newline='', encoding='utf-8') as f:
-    writer = csv.writer(f)
-    writer.writerow(['timestamp', 'user_id', 'nickname', 'share_type', 'share_target', 'share_count', 'users_joined', 'action'])
-
-with open(joins_csv, 'w', newline='', encoding='utf-8') as f:
+extension = "parquet" if OUTPUT_FORMAT == "parquet" else "csv"
+comments_csv = f"recordings/{username}_{timestamp}_comments.{extension}"
+gifts_csv = f"recordings/{username}_{timestamp}_gifts.{extension}"
+follows_csv = f"recordings/{username}_{timestamp}_follows.{extension}"
+shares_csv = f"recordings/{username}_{timestamp}_shares.{extension}"
+joins_csv = f"recordings/{username}_{timestamp}_joins.{extension}"
+
+# Keep one buffered handle per CSV for the whole session instead of
+# reopening the file for every event
+CSV_BUFFER_SIZE = 1 << 16
+FLUSH_INTERVAL_SECONDS = 1
+
+def open_csv(path, header):
+    """Create a CSV with its header and return an append-only buffered handle and writer"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+    f = open(fd, 'a', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE)
     writer = csv.writer(f)
-    writer.writerow(['timestamp', 'user_id', 'nickname', 'count', 'is_top_user', 'enter_type', 'action', 'user_share_type', 'client_enter_source'])
-
-print(f"📁 CSV files will be saved as:")
+    writer.writerow(header)
+    return f, writer
+
+PARQUET_BATCH_ROWS = 10_000
+
+class ParquetEventLog:
+    """Collects event rows in memory and writes them to Parquet in large row groups"""
+
+    def __init__(self, path, header):
+        # TikTokLive's field types vary between releases, so values are stored as strings
+        self.schema = pa.schema([(column, pa.string()) for column in header])
+        self.writer = pq.ParquetWriter(path, self.schema, compression='zstd')
+        self.rows = []
+        self.closed = False
+
+    def writerows(self, rows):
+        self.rows.extend(rows)
+        if len(self.rows) >= PARQUET_BATCH_ROWS:
+            self.write_batch()
+
+    def write_batch(self):
+        if not self.rows:
+            return
+        columns = {
+            column: [None if value is None else str(value) for value in values]
+            for column, values in zip(self.schema.names, zip(*self.rows))
+        }
+        self.writer.write_table(pa.table(columns, schema=self.schema))
+        self.rows = []
+
+    def flush(self):
+        # Rows are only written as whole row groups; see write_batch and close
+        pass
+
+    def close(self):
+        if not self.closed:
+            self.write_batch()
+            self.writer.close()
+            self.closed = True
+
+def open_event_log(path, header):
+    if OUTPUT_FORMAT == "parquet":
+        event_log = ParquetEventLog(path, header)
+        return event_log, event_log
+    return open_csv(path, header)
+
+comments_file, comments_writer = open_event_log(comments_csv, ['timestamp', 'user_id', 'nickname', 'comment', 'follower_count'])
+gifts_file, gifts_writer = open_event_log(gifts_csv, ['timestamp', 'user_id', 'nickname', 'gift_name', 'repeat_count', 'streakable', 'streaking'])
+follows_file, follows_writer = open_event_log(follows_csv, ['timestamp', 'user_id', 'nickname', 'follow_count', 'share_type', 'action'])
+shares_file, shares_writer = open_event_log(shares_csv, ['timestamp', 'user_id', 'nickname', 'share_type', 'share_target', 'share_count', 'users_joined', 'action'])
+joins_file, joins_writer = open_event_log(joins_csv, ['timestamp', 'user_id', 'nickname', 'count', 'is_top_user', 'enter_type', 'action', 'user_share_type', 'client_enter_source'])
+csv_handles = [comments_file, gifts_file, follows_file, shares_file, joins_file]
+event_writers = {
+    "comments": (comments_file, comments_writer),
+    "gifts": (gifts_file, gifts_writer),
+    "follows": (follows_file, follows_writer),
+    "shares": (shares_file, shares_writer),
+    "joins": (joins_file, joins_writer),
+}
+
+# Handlers only queue rows; writer_loop hands them to a worker thread so
+# disk I/O never blocks the websocket reads on the event loop
+pending_rows = {kind: [] for kind in event_writers}
+writer_task = None
+writer_stop = None
+
+# Rows written per CSV, reported in the session summary
+counters = {"comments": 0, "gifts": 0, "follows": 0, "shares": 0, "joins": 0}
+
+# The date/time part of event timestamps is formatted once per second;
+# each event still gets its own microseconds
+_timestamp_cache = [None, ""]
+
+def now_iso():
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    if second != _timestamp_cache[0]:
+        _timestamp_cache[0] = second
+        _timestamp_cache[1] = datetime.fromtimestamp(second).isoformat()
+    return f"{_timestamp_cache[1]}.{nanos // 1000:06d}"
+
+def take_pending_rows():
+    batches = [(kind, rows) for kind, rows in pending_rows.items() if rows]
+    for kind, _ in batches:
+        pending_rows[kind] = []
+    return batches
+
+def write_batches(batches):
+    for kind, rows in batches:
+        f, writer = event_writers[kind]
+        if not f.closed:
+            writer.writerows(rows)
+            f.flush()
+
+async def writer_loop():
+    """Write queued rows to disk about once a second, and once more when stopped"""
+    loop = asyncio.get_running_loop()
+    while not writer_stop.is_set():
+        try:
+            await asyncio.wait_for(writer_stop.wait(), FLUSH_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        batches = take_pending_rows()
+        if batches:
+            await loop.run_in_executor(None, write_batches, batches)
+
+print(f"📁 Event files will be saved as:")
 print(f"   Comments: {comments_csv}")
 print(f"   Gifts: {gifts_csv}")
 print(f"   Follows: {follows_csv}")
@@ -74,9 +175,14 @@ print(f"   Joins: {joins_csv}")
 # Recording
 @client.on(ConnectEvent)
 async def on_connect(event: ConnectEvent):
+    global writer_task, writer_stop
     client.logger.info("Connected!")
     print(f"✅ Connected to @{event.unique_id}'s live stream!")
 
+    if writer_task is None:
+        writer_stop = asyncio.Event()
+        writer_task = asyncio.create_task(writer_loop())
+
     # Start a recording
     video_file = f"recordings/{username}_{timestamp}.mp4"
     try:
@@ -91,28 +197,27 @@ async def on_connect(event: ConnectEvent):
 
 # Comments in chat
 async def on_comment(event: CommentEvent) -> None:
-    timestamp_now = datetime.now().isoformat()
+    timestamp_now = now_iso()
 
     # Print to console
     print(f"💬 {event.user.nickname}: {event.comment}")
 
     # Save to CSV
-    with open(comments_csv, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            timestamp_now,
-            getattr(event.user, 'unique_id', ''),
-            getattr(event.user, 'nickname', ''),
-            event.comment,
-            getattr(event.user, 'follower_count', 0)
-        ])
+    pending_rows["comments"].append([
+        timestamp_now,
+        getattr(event.user, 'unique_id', ''),
+        getattr(event.user, 'nickname', ''),
+        event.comment,
+        getattr(event.user, 'follower_count', 0)
+    ])
+    counters["comments"] += 1
 
 client.add_listener(CommentEvent, on_comment)
 
 # Gifts
 @client.on(GiftEvent)
 async def on_gift(event: GiftEvent):
-    timestamp_now = datetime.now().isoformat()
+    timestamp_now = now_iso()
 
     client.logger.info("Received a gift!")
 
@@ -123,22 +228,21 @@ async def on_gift(event: GiftEvent):
         print(f"🎁 {event.user.nickname} sent \"{event.gift.name}\"")
 
     # Save to CSV
-    with open(gifts_csv, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            timestamp_now,
-            getattr(event.user, 'unique_id', ''),
-            getattr(event.user, 'nickname', ''),
-            event.gift.name,
-            event.repeat_count,
-            event.gift.streakable,
-            event.streaking
-        ])
+    pending_rows["gifts"].append([
+        timestamp_now,
+        getattr(event.user, 'unique_id', ''),
+        getattr(event.user, 'nickname', ''),
+        event.gift.name,
+        event.repeat_count,
+        event.gift.streakable,
+        event.streaking
+    ])
+    counters["gifts"] += 1
 
 # Follows
 @client.on(FollowEvent)
 async def on_follow(event: FollowEvent):
-    timestamp_now = datetime.now().isoformat()
+    timestamp_now = now_iso()
 
     client.logger.info("New follow!")
 
@@ -146,21 +250,20 @@ async def on_follow(event: FollowEvent):
     print(f"👤 {event.user.nickname} followed the streamer!")
 
     # Save to CSV
-    with open(follows_csv, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            timestamp_now,
-            getattr(event.user, 'unique_id', ''),
-            getattr(event.user, 'nickname', ''),
-            getattr(event, 'follow_count', 0),
-            getattr(event, 'share_type', 0),
-            getattr(event, 'action', 0)
-        ])
+    pending_rows["follows"].append([
+        timestamp_now,
+        getattr(event.user, 'unique_id', ''),
+        getattr(event.user, 'nickname', ''),
+        getattr(event, 'follow_count', 0),
+        getattr(event, 'share_type', 0),
+        getattr(event, 'action', 0)
+    ])
+    counters["follows"] += 1
 
 # User Joins
 @client.on(JoinEvent)
 async def on_join(event: JoinEvent):
-    timestamp_now = datetime.now().isoformat()
+    timestamp_now = now_iso()
 
     # Print to console
     join_msg = f"🚪 {event.user.nickname} joined the stream"
@@ -174,24 +277,23 @@ async def on_join(event: JoinEvent):
     print(join_msg)
 
     # Save to CSV
-    with open(joins_csv, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            timestamp_now,
-            getattr(event.user, 'unique_id', ''),
-            getattr(event.user, 'nickname', ''),
-            getattr(event, 'count', 0),
-            getattr(event, 'is_top_user', False),
-            getattr(event, 'enter_type', 0),
-            getattr(event, 'action', 0),
-            getattr(event, 'user_share_type', ''),
-            getattr(event, 'client_enter_source', '')
-        ])
+    pending_rows["joins"].append([
+        timestamp_now,
+        getattr(event.user, 'unique_id', ''),
+        getattr(event.user, 'nickname', ''),
+        getattr(event, 'count', 0),
+        getattr(event, 'is_top_user', False),
+        getattr(event, 'enter_type', 0),
+        getattr(event, 'action', 0),
+        getattr(event, 'user_share_type', ''),
+        getattr(event, 'client_enter_source', '')
+    ])
+    counters["joins"] += 1
 
 # Shares
 @client.on(ShareEvent)
 async def on_share(event: ShareEvent):
-    timestamp_now = datetime.now().isoformat()
+    timestamp_now = now_iso()
 
     client.logger.info("Stream shared!")
 
@@ -203,53 +305,40 @@ async def on_share(event: ShareEvent):
         print(f"   👥 {users_joined} users joined from this share!")
 
     # Save to CSV
-    with open(shares_csv, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            timestamp_now,
-            getattr(event.user, 'unique_id', ''),
-            getattr(event.user, 'nickname', ''),
-            getattr(event, 'share_type', 0),
-            share_target,
-            getattr(event, 'share_count', 0),
-            users_joined,
-            getattr(event, 'action', 0)
-        ])
+    pending_rows["shares"].append([
+        timestamp_now,
+        getattr(event.user, 'unique_id', ''),
+        getattr(event.user, 'nickname', ''),
+        getattr(event, 'share_type', 0),
+        share_target,
+        getattr(event, 'share_count', 0),
+        users_joined,
+        getattr(event, 'action', 0)
+    ])
+    counters["shares"] += 1
 
 @client.on(DisconnectEvent)
 async def on_live_end(_: DisconnectEvent):
     """Stop the download when we disconnect"""
+    global writer_task
     client.logger.info("Disconnected!")
 
     if client.web.fetch_video_data.is_recording:
         client.web.fetch_video_data.stop()
 
-    # Print session summary
-    try:
-        with open(comments_csv, 'r', encoding='utf-8') as f:
-            comment_count = sum(1 for line in f) - 1  # Subtract header
-
-        with open(gifts_csv, 'r', encoding='utf-8') as f:
-            gift_count = sum(1 for line in f) - 1  # Subtract header
+    if writer_task is not None:
+        writer_stop.set()
+        await writer_task
+        writer_task = None
 
-        with open(follows_csv, 'r', encoding='utf-8') as f:
-            follow_count = sum(1 for line in f) - 1  # Subtract header
-
-        with open(shares_csv, 'r', encoding='utf-8') as f:
-            share_count = sum(1 for line in f) - 1  # Subtract header
-
-        with open(joins_csv, 'r', encoding='utf-8') as f:
-            join_count = sum(1 for line in f) - 1  # Subtract header
-
-        print(f"\n📊 Session Summary:")
-        print(f"   Comments captured: {comment_count}")
-        print(f"   Gifts captured: {gift_count}")
-        print(f"   Follows captured: {follow_count}")
-        print(f"   Shares captured: {share_count}")
-        print(f"   Joins captured: {join_count}")
-        print(f"   Files saved in: recordings/")
-    except Exception as e:
-        print(f"Error generating summary: {e}")
+    # Print session summary
+    print(f"\n📊 Session Summary:")
+    print(f"   Comments captured: {counters['comments']}")
+    print(f"   Gifts captured: {counters['gifts']}")
+    print(f"   Follows captured: {counters['follows']}")
+    print(f"   Shares captured: {counters['shares']}")
+    print(f"   Joins captured: {counters['joins']}")
+    print(f"   Files saved in: recordings/")
 
 if __name__ == '__main__':
     print(f"🔴 Starting TikTok Live recorder for {STREAMER_USERNAME}")
@@ -270,4 +359,8 @@ if __name__ == '__main__':
         elif "not live" in str(e).lower():
             print("💡 The streamer is not currently live")
     finally:
+        # Rows still queued if the loop stopped before the disconnect handler ran
+        write_batches(take_pending_rows())
+        for f in csv_handles:
+            f.close()
         print("🏁 Recorder stopped.")
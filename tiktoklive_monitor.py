@@ -1,32 +1,279 @@
 import asyncio
+import atexit
 import csv
+import functools
+import heapq
 import json
 import os
+import re
 import signal
 import sys
+import time
 import argparse
 import platform
 import resource
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional, Set, Union
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 
+import httpx
 from TikTokLive.client.client import TikTokLiveClient
 from TikTokLive.client.logger import LogLevel
 from TikTokLive.events import ConnectEvent, DisconnectEvent, CommentEvent, GiftEvent
 from TikTokLive.events.custom_events import FollowEvent, ShareEvent, LiveEndEvent
 from TikTokLive.events.proto_events import JoinEvent, LikeEvent
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _json_line(obj) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:  # orjson is optional; fall back to the json module
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def _json_line(obj) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=str) + '\n').encode('utf-8')
+
+# HTTP/2 lets concurrent live checks share one TLS connection; httpx needs the
+# optional h2 package for it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Parquet event files need the optional pyarrow package
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Event files are "csv" (default), "jsonl" or "parquet", see the event_format setting
+EVENT_FORMATS = ('csv', 'jsonl', 'parquet')
+
+# Event CSVs stay open for the whole recording behind a large write buffer
+CSV_BUFFER_SIZE = 64 * 1024
+# Rows are collected in memory and written out in batches
+CSV_FLUSH_ROWS = 256
+CSV_FLUSH_INTERVAL_SECONDS = 0.5
+
+CSV_HEADERS = {
+    'comments': ['timestamp', 'user_id', 'nickname', 'comment', 'follower_count'],
+    'gifts': ['timestamp', 'user_id', 'nickname', 'gift_name', 'repeat_count', 'streakable', 'streaking'],
+    'follows': ['timestamp', 'user_id', 'nickname', 'follow_count', 'share_type', 'action'],
+    'shares': ['timestamp', 'user_id', 'nickname', 'share_type', 'share_target', 'share_count', 'users_joined', 'action'],
+    'joins': ['timestamp', 'user_id', 'nickname', 'count', 'is_top_user', 'enter_type', 'action', 'user_share_type', 'client_enter_source'],
+    'likes': ['timestamp', 'user_id', 'nickname', 'count', 'total', 'color', 'effect_cnt']
+}
+# Header lines as csv.writer would produce them, encoded once at import
+CSV_HEADER_LINES = {csv_type: (','.join(columns) + '\r\n').encode('utf-8')
+                    for csv_type, columns in CSV_HEADERS.items()}
+
+# ffmpeg writes the video on its own; every so often the kernel is told to drop
+# the pages it already wrote, so a high-bitrate stream doesn't push the event
+# CSVs of other recordings out of the page cache
+VIDEO_CACHE_DROP_BYTES = 16 * 1024 * 1024
+VIDEO_CACHE_DROP_INTERVAL_SECONDS = 10
+
+# Routine status updates that don't change the state are skipped if one was written this recently
+STATUS_FILE_MIN_INTERVAL_SECONDS = 1.0
+
+# With inotify the config mtime is still polled, this many times less often, for
+# edits the watch can miss (file replaced by rename, network filesystems)
+CONFIG_WATCH_FALLBACK_FACTOR = 10
+
+def _stamp_rows(rows: List[tuple]):
+    """Yield (ISO timestamp, fields) for buffered (time_ns, fields) rows, formatting each distinct second only once"""
+    last_second = None
+    prefix = ""
+    for timestamp_ns, fields in rows:
+        second, nanos = divmod(timestamp_ns, 1_000_000_000)
+        if second != last_second:
+            last_second = second
+            prefix = datetime.fromtimestamp(second).isoformat()
+        yield f"{prefix}.{nanos // 1000:06d}", fields
+
+def format_csv_rows(rows: List[tuple]) -> bytes:
+    return ''.join(
+        f"{timestamp},{','.join(map(csv_escape, fields))}\r\n" for timestamp, fields in _stamp_rows(rows)
+    ).encode('utf-8')
+
+def format_jsonl_rows(columns: List[str], rows: List[tuple]) -> bytes:
+    return b''.join(_json_line(dict(zip(columns, (timestamp,) + fields))) for timestamp, fields in _stamp_rows(rows))
+
+if PARQUET_AVAILABLE:
+    # One file per recording: the columns all events share, the rest as a JSON object
+    PARQUET_SCHEMA = pa.schema([
+        ('event_type', pa.string()),
+        ('timestamp', pa.timestamp('us', tz='UTC')),
+        ('user_id', pa.string()),
+        ('nickname', pa.string()),
+        ('data', pa.string())
+    ])
+# Buffered rows are written as one row group once there are this many
+PARQUET_ROW_GROUP_ROWS = 64 * 1024
+
+def format_parquet_rows(event_type: str, columns: List[str], rows: List[tuple]):
+    data_columns = columns[3:]
+    return pa.Table.from_arrays([
+        pa.array([event_type] * len(rows), pa.string()),
+        pa.array([timestamp_ns // 1000 for timestamp_ns, _ in rows], PARQUET_SCHEMA.field('timestamp').type),
+        pa.array([None if fields[0] is None else str(fields[0]) for _, fields in rows], pa.string()),
+        pa.array([None if fields[1] is None else str(fields[1]) for _, fields in rows], pa.string()),
+        pa.array([_json_line(dict(zip(data_columns, fields[2:])))[:-1].decode('utf-8') for _, fields in rows],
+                 pa.string())
+    ], schema=PARQUET_SCHEMA)
+
+class ParquetEventFile:
+    """Shared Parquet sink for all event types of one recording; only used from the I/O thread"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.closed = False
+        self._file = None
+        self._writer = None
+        self._tables = []
+        self._rows = 0
+
+    def _open(self):
+        self._file = open(self.path, 'wb', buffering=CSV_BUFFER_SIZE)
+        self._writer = pq.ParquetWriter(self._file, PARQUET_SCHEMA, compression='zstd')
+
+    def write(self, table):
+        self._tables.append(table)
+        self._rows += table.num_rows
+        if self._rows >= PARQUET_ROW_GROUP_ROWS:
+            self._write_row_group()
+
+    def flush(self):
+        # Row groups are written once full; small ones would undo the compression
+        pass
+
+    def _write_row_group(self):
+        if self._writer is None:
+            self._open()
+        if self._tables:
+            self._writer.write_table(pa.concat_tables(self._tables))
+        self._tables = []
+        self._rows = 0
+
+    def close(self):
+        if self.closed:
+            return
+        # A recording without events still gets a file holding just the schema
+        self._write_row_group()
+        self._writer.close()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self.closed = True
+
+def write_file_atomically(path: Path, data: bytes):
+    """Replace a file in one step so readers never see it half-written"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def drop_video_page_cache(path: Path, offset: int) -> int:
+    """Advise the kernel to evict written video pages up to the last whole chunk; returns the new offset"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        end = os.fstat(fd).st_size // VIDEO_CACHE_DROP_BYTES * VIDEO_CACHE_DROP_BYTES
+        if end <= offset:
+            return offset
+        # Repeat the previous chunk: pages still dirty last time could not be dropped yet
+        start = max(0, offset - VIDEO_CACHE_DROP_BYTES)
+        os.posix_fadvise(fd, start, end - start, os.POSIX_FADV_DONTNEED)
+        return end
+    finally:
+        os.close(fd)
+
+def release_video_file(path: Path) -> int:
+    """Flush a finished video to disk and evict it from the page cache; returns its size in bytes"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            # Dirty pages can't be dropped, so write them out first
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        return os.fstat(fd).st_size
+    finally:
+        os.close(fd)
+
+_MISSING = object()
+
+def _get_field(obj, path: str, default):
+    for name in path.split('.'):
+        obj = getattr(obj, name, _MISSING)
+        if obj is _MISSING:
+            return default
+    return obj
+
+def make_field_extractor(*fields) -> Callable[[object], tuple]:
+    """Build a function returning the given (dotted attribute, default) fields of an event as a tuple"""
+    getter = attrgetter(*(path for path, _ in fields))
+
+    def extract(event) -> tuple:
+        try:
+            return getter(event)
+        except AttributeError:
+            # Older or newer TikTokLive releases may lack a field; use the defaults
+            return tuple(_get_field(event, path, default) for path, default in fields)
+
+    return extract
+
+_USER = (('user.unique_id', ''), ('user.nickname', ''))
+comment_fields = make_field_extractor(*_USER, ('comment', ''), ('user.follower_count', 0))
+gift_fields = make_field_extractor(*_USER, ('gift.name', ''), ('repeat_count', 0),
+                                   ('gift.streakable', False), ('streaking', False))
+follow_fields = make_field_extractor(*_USER, ('follow_count', 0), ('share_type', 0), ('action', 0))
+share_fields = make_field_extractor(*_USER, ('share_type', 0), ('share_target', 'unknown'),
+                                    ('share_count', 0), ('users_joined', 0), ('action', 0))
+join_fields = make_field_extractor(*_USER, ('count', 0), ('is_top_user', False), ('enter_type', 0),
+                                   ('action', 0), ('user_share_type', ''), ('client_enter_source', ''))
+like_fields = make_field_extractor(*_USER, ('count', 0), ('total', 0), ('color', 0), ('effect_cnt', 0))
+
+_CSV_SPECIAL_CHARS = re.compile(r'[,"\r\n]')
+# Counts and flags can never need quoting, so they skip the scan
+_CSV_PLAIN_TYPES = (int, bool, float)
+
+def csv_escape(value) -> str:
+    """Quote a free-text CSV field the way csv.writer would, only when needed"""
+    if value is None:
+        return ''
+    if type(value) in _CSV_PLAIN_TYPES:
+        return str(value)
+    text = value if isinstance(value, str) else str(value)
+    if _CSV_SPECIAL_CHARS.search(text):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
 class StreamMonitor:
     """Monitor multiple TikTok streamers and auto-record when they go live"""
 
-    def __init__(self, config_file: str = "streamers_config.json", session_id: Optional[str] = None):
-        self.config_file = config_file
+    def __init__(self, config_file: Union[str, Path] = "streamers_config.json", session_id: Optional[str] = None):
+        self.config_file = Path(config_file)
         self.global_session_id = session_id  # Command line session ID takes precedence
         self.config = self.load_config()  # Load config first
         self.config_last_modified = self.get_config_mtime()  # Track file modification time
         self.active_recordings: Dict[str, dict] = {}
+        # Teardowns in progress; the recording stays in active_recordings until its task is done
+        self._stopping: Dict[str, asyncio.Task] = {}
         self.monitoring = True
         self.is_windows = platform.system() == "Windows"
 
@@ -39,6 +286,23 @@ class StreamMonitor:
         self.disconnect_confirmation_delay = self.config['settings'].get('disconnect_confirmation_delay_seconds', 30)
         self.pending_disconnects: Dict[str, dict] = {}
 
+        # Adaptive polling: when each streamer is next due for a check, and how
+        # many checks in a row found them offline; rebuild_caches() turns the
+        # due times into the _schedule heap
+        self._next_check: Dict[str, float] = {}
+        self._offline_checks: Dict[str, int] = {}
+
+        # Output directories already created during this run
+        self._created_dirs: Set[Path] = set()
+
+        # Bounds how many live checks hit TikTok at once; created on first use
+        # so it belongs to the running event loop
+        self._check_semaphore: Optional[asyncio.Semaphore] = None
+
+        # One probe client per (session_id, tt_target_idc), reused across check
+        # cycles so its HTTP connections stay pooled
+        self._probe_clients: Dict[tuple, TikTokLiveClient] = {}
+
         # Use Path for cross-platform compatibility
         self.session_log_file = Path(f"monitoring_sessions_{datetime.now().strftime('%Y%m%d')}.csv")
 
@@ -51,16 +315,23 @@ class StreamMonitor:
         if self.global_session_id:
             self.config['settings']['session_id'] = self.global_session_id
 
-        # Set up logging with filtered levels
+        # The config file's mtime is checked about once a minute rather than every cycle
+        self._config_check_counter = 0
+
+        # Set up logging with filtered levels. Records go through a queue to a
+        # listener thread, so the log file and console writes happen off the event loop
         log_file = Path(f"monitor_{datetime.now().strftime('%Y%m%d')}.log")
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
+        log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        log_handlers = [logging.FileHandler(log_file, encoding='utf-8'), logging.StreamHandler()]
+        for handler in log_handlers:
+            handler.setFormatter(log_formatter)
+        log_queue = queue.SimpleQueue()
+        self._log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)  # Writes out whatever is still queued
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Handlers behind the queue add the prefix
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
         self.logger = logging.getLogger(__name__)
 
         # Silence verbose HTTP logs from TikTokLive and httpx
@@ -73,6 +344,9 @@ class StreamMonitor:
         # Only show our monitor logs at INFO level
         self.logger.setLevel(logging.INFO)
 
+        # Needs the logger, to warn about unusable streamer entries
+        self.rebuild_caches()
+
         # Log session ID usage
         if self.global_session_id:
             self.logger.info(f"🔑 Using session ID from command line argument")
@@ -81,17 +355,43 @@ class StreamMonitor:
         else:
             self.logger.info("ℹ️  No session ID provided - only public streams accessible")
 
-        # Ensure environment variable is always set when using session IDs
+        # rebuild_caches() has already exported the sign server whitelist
         if self.config['settings'].get('session_id'):
-            whitelist_host = self.config['settings'].get('whitelist_sign_server', 'tiktok.eulerstream.com')
-            os.environ['WHITELIST_AUTHENTICATED_SESSION_ID_HOST'] = whitelist_host
-            self.logger.info(f"🔐 Sign server whitelisted: {whitelist_host}")
+            self.logger.info(f"🔐 Sign server whitelisted: {os.environ['WHITELIST_AUTHENTICATED_SESSION_ID_HOST']}")
+
+        # Disk writes run on a single worker thread so they never stall the event
+        # loop, and writes queued for the same file keep their order
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="csv-io")
 
         # Initialize session log
         self.init_session_log()
 
-        # Set up signal handlers for graceful shutdown (Windows compatible)
-        self.setup_signal_handlers()
+        # Set by run(); signal handlers and executor calls go through it
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._monitor_task: Optional[asyncio.Task] = None
+        # One task drains the event buffers of every recording
+        self._flush_task: Optional[asyncio.Task] = None
+        # Fire-and-forget tasks, kept referenced until they finish
+        self._background_tasks: Set[asyncio.Task] = set()
+        # The subset run() cancels at shutdown; recordings already being stopped are let finish
+        self._cancellable_tasks: Set[asyncio.Task] = set()
+
+        # Control requests from SIGUSR1/SIGUSR2, and an optional inotify watch
+        # that tells check_control_signals when the control files need a look
+        # and the monitor loop when the config file changed
+        self._requested_control: Optional[str] = None
+        self._control_watch = None
+        self._control_files_dirty = True
+        # Starts set so edits made before the watch is in place are still noticed
+        self._config_dirty = True
+        # Set when a control request arrives so the monitor loop stops sleeping; created by run()
+        self._wakeup: Optional[asyncio.Event] = None
+
+        # Status file writes run in the executor, one at a time
+        self._pending_status: Optional[bytes] = None
+        self._status_future: Optional[asyncio.Future] = None
+        self._status_state: Optional[tuple] = None
+        self._status_updated_at = 0.0
 
         # Clean up any existing control files
         self.cleanup_control_files()
@@ -157,14 +457,14 @@ class StreamMonitor:
                 time_since_action = now - stability_info['last_action_time']
                 if time_since_action.total_seconds() >= self.min_action_cooldown:
                     stability_info['last_action_time'] = now
-                    self.logger.debug(f"✅ {username} stability confirmed for LIVE after {stability_info['consecutive_live']} checks")
+                    self.logger.debug("✅ %s stability confirmed for LIVE after %s checks", username, stability_info['consecutive_live'])
                     return True
                 else:
                     remaining_cooldown = self.min_action_cooldown - time_since_action.total_seconds()
-                    self.logger.debug(f"⏳ {username} stability confirmed but in cooldown ({remaining_cooldown:.0f}s remaining)")
+                    self.logger.debug("⏳ %s stability confirmed but in cooldown (%.0fs remaining)", username, remaining_cooldown)
                     return False
             else:
-                self.logger.debug(f"📊 {username} LIVE tracking: {stability_info['consecutive_live']}/{self.stability_threshold}")
+                self.logger.debug("📊 %s LIVE tracking: %s/%s", username, stability_info['consecutive_live'], self.stability_threshold)
                 return False
 
         # For going offline via polling: REMOVED - no longer use polling for termination
@@ -211,7 +511,7 @@ class StreamMonitor:
                     self.logger.warning(f"   Consider reducing to {max_concurrent} or increasing ulimit")
 
         except Exception as e:
-            self.logger.debug(f"Could not check system limits: {e}")
+            self.logger.debug("Could not check system limits: %s", e)
 
     def get_open_file_count(self) -> int:
         """Get current number of open file descriptors (Unix only)"""
@@ -223,11 +523,11 @@ class StreamMonitor:
         except:
             return 0
 
-    def setup_signal_handlers(self):
+    def setup_signal_handlers(self, loop: asyncio.AbstractEventLoop):
         """Set up signal handlers compatible with Windows"""
         try:
             if self.is_windows:
-                # Windows supports limited signals
+                # Windows event loops don't support add_signal_handler
                 signal.signal(signal.SIGINT, self.signal_handler)
                 signal.signal(signal.SIGTERM, self.signal_handler)
                 # SIGBREAK is Windows-specific
@@ -235,19 +535,83 @@ class StreamMonitor:
                     signal.signal(signal.SIGBREAK, self.signal_handler)
             else:
                 # Unix-like systems support more signals
-                signal.signal(signal.SIGINT, self.signal_handler)
-                signal.signal(signal.SIGTERM, self.signal_handler)
-                signal.signal(signal.SIGHUP, self.signal_handler)
+                for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+                    loop.add_signal_handler(signum, self.request_shutdown, signum)
+                # Signal equivalents of the pause and stop control files
+                loop.add_signal_handler(signal.SIGUSR1, self.request_control, "pause:60")
+                loop.add_signal_handler(signal.SIGUSR2, self.request_control, "stop:sigusr2")
         except Exception as e:
             self.logger.warning(f"Could not set up all signal handlers: {e}")
 
+    def request_control(self, control_signal: str):
+        self.logger.info(f"📨 Control request received: {control_signal}")
+        self._requested_control = control_signal
+        self.wake_up()
+
+    def wake_up(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def wait_for_wakeup(self, timeout: float):
+        """Sleep for up to timeout seconds, returning early when a control request comes in"""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    def watch_control_files(self, loop: asyncio.AbstractEventLoop):
+        """Use inotify (if inotify_simple is installed) instead of probing the control files every cycle"""
+        try:
+            from inotify_simple import INotify, flags
+        except ImportError:
+            return
+
+        control_names = {self.stop_file.name, self.pause_file.name}
+        # CLOSE_WRITE rather than CREATE: a control file is only read once its contents are written
+        watch_flags = flags.CLOSE_WRITE | flags.MOVED_TO
+        try:
+            inotify = INotify()
+            control_wd = inotify.add_watch(str(self.stop_file.resolve().parent), watch_flags)
+            # The config file is watched too, so edits are picked up without polling its mtime
+            config_wd = inotify.add_watch(str(self.config_file.resolve().parent), watch_flags)
+        except OSError as e:
+            self.logger.debug("Could not watch control files: %s", e)
+            return
+
+        def on_control_dir_event():
+            for event in inotify.read(timeout=0):
+                if event.wd == control_wd and event.name in control_names:
+                    self._control_files_dirty = True
+                    self.wake_up()
+                if event.wd == config_wd and event.name == self.config_file.name:
+                    # Not a wakeup: the change is applied at the next cycle, after
+                    # an editor's save sequence has finished
+                    self._config_dirty = True
+
+        try:
+            loop.add_reader(inotify.fileno(), on_control_dir_event)
+        except (NotImplementedError, RuntimeError) as e:
+            self.logger.debug("Could not watch control files: %s", e)
+            inotify.close()
+            return
+        self._control_watch = inotify
+
+    def stop_watching_control_files(self):
+        if self._control_watch is not None:
+            try:
+                self._loop.remove_reader(self._control_watch.fileno())
+            finally:
+                self._control_watch.close()
+                self._control_watch = None
+
     def cleanup_control_files(self):
         """Remove any existing control files from previous runs"""
         for file_path in [self.stop_file, self.pause_file]:
             if file_path.exists():
                 try:
                     file_path.unlink()
-                    self.logger.debug(f"Removed existing control file: {file_path}")
+                    self.logger.debug("Removed existing control file: %s", file_path)
                 except Exception as e:
                     self.logger.warning(f"Could not remove {file_path}: {e}")
 
@@ -265,14 +629,62 @@ class StreamMonitor:
                 "platform": platform.system()
             }
 
-            with open(self.status_file, 'w', encoding='utf-8') as f:
-                json.dump(status_info, f, indent=2, ensure_ascii=False)
+            if self._loop is None or not self.monitoring:
+                # Starting up or shutting down: write right away so the last state sticks;
+                # callers await settle_status_file() first so no queued write lands after it
+                self._pending_status = None
+                write_file_atomically(self.status_file, _json_dumps(status_info))
+                return
+
+            # Nothing but the timestamp changed since the last write: skip it if that was just now
+            state = (status, extra_info, tuple(status_info["currently_recording"]), status_info["pending_disconnects"])
+            now = time.monotonic()
+            if state == self._status_state and now - self._status_updated_at < STATUS_FILE_MIN_INTERVAL_SECONDS:
+                return
+            self._status_state = state
+            self._status_updated_at = now
+
+            data = _json_dumps(status_info)
+
+            # Coalesced: while a write is in flight only the newest status is kept
+            self._pending_status = data
+            if self._status_future is None:
+                self._write_pending_status()
 
         except Exception as e:
-            self.logger.debug(f"Could not update status file: {e}")
+            self.logger.debug("Could not update status file: %s", e)
+
+    def _write_pending_status(self):
+        data, self._pending_status = self._pending_status, None
+        self._status_future = self._loop.run_in_executor(None, write_file_atomically, self.status_file, data)
+        self._status_future.add_done_callback(self._status_written)
+
+    def _status_written(self, future):
+        self._status_future = None
+        if not future.cancelled() and future.exception() is not None:
+            self.logger.debug("Could not update status file: %s", future.exception())
+        # Once monitoring stops, only the synchronous shutdown states may be written
+        if self._pending_status is not None and self.monitoring:
+            self._write_pending_status()
+        else:
+            self._pending_status = None
+
+    async def settle_status_file(self):
+        """Drop any queued status and wait for an in-flight write, so a synchronous write can't be overtaken"""
+        self._pending_status = None
+        while self._status_future is not None:
+            await asyncio.wait({self._status_future})
 
     def check_control_signals(self) -> str:
-        """Check for file-based control signals"""
+        """Check for signal- and file-based control signals"""
+        if self._requested_control is not None:
+            control_signal, self._requested_control = self._requested_control, None
+            return control_signal
+
+        # With an inotify watch the files only need checking after a change
+        if self._control_watch is not None and not self._control_files_dirty:
+            return "continue"
+
         # Check for stop signal
         if self.stop_file.exists():
             try:
@@ -293,28 +705,29 @@ class StreamMonitor:
             except Exception:
                 return "pause:60"
 
+        self._control_files_dirty = False
         return "continue"
 
-    def get_config_mtime(self) -> float:
-        """Get the modification time of the config file"""
+    def get_config_mtime(self) -> int:
+        """Get the modification time of the config file, in nanoseconds"""
         try:
-            config_path = Path(self.config_file)
-            if config_path.exists():
-                return config_path.stat().st_mtime
-            return 0.0
-        except Exception:
-            return 0.0
-
-    def check_config_changes(self) -> bool:
+            # One stat call; a missing file simply raises
+            return self.config_file.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    async def check_config_changes(self) -> bool:
         """Check if the config file has been modified and reload if needed"""
         try:
-            current_mtime = self.get_config_mtime()
-            if current_mtime > self.config_last_modified:
+            current_mtime = await self._loop.run_in_executor(None, self.get_config_mtime)
+            # Any change counts, so restoring an older copy is picked up too; a
+            # missing file (mtime 0) keeps the current config
+            if current_mtime and current_mtime != self.config_last_modified:
                 self.logger.info("📝 Config file changed, reloading...")
 
                 # Store old config for comparison
                 old_streamers = set(self.config.get('streamers', {}).keys())
-                old_enabled = {k: v.get('enabled', True) for k, v in self.config.get('streamers', {}).items()}
+                old_enabled = set(self._enabled_streamers.keys())
 
                 # Reload config
                 new_config = self.load_config()
@@ -325,6 +738,14 @@ class StreamMonitor:
 
                 self.config = new_config
                 self.config_last_modified = current_mtime
+                self.rebuild_caches()
+                self.discard_probe_clients()
+                self._check_semaphore = None  # Recreated with the new max_parallel_checks
+                # Running sessions pick up edited tags/notes; removed streamers keep their snapshot
+                for username, recording_info in self.active_recordings.items():
+                    if username in self._streamer_cache:
+                        recording_info['streamer_config'] = self._streamer_by_username[username]
+                        recording_info['streamer_settings'] = self._streamer_cache[username]
 
                 # Update stability settings
                 self.stability_threshold = self.config['settings'].get('stability_threshold', 3)
@@ -333,34 +754,29 @@ class StreamMonitor:
 
                 # Compare changes
                 new_streamers = set(self.config.get('streamers', {}).keys())
-                new_enabled = {k: v.get('enabled', True) for k, v in self.config.get('streamers', {}).items()}
+                new_enabled = set(self._enabled_streamers.keys())
 
                 # Log changes
                 added = new_streamers - old_streamers
                 removed = old_streamers - new_streamers
-                status_changed = []
-
-                for streamer in old_streamers & new_streamers:
-                    old_status = old_enabled.get(streamer, True)
-                    new_status = new_enabled.get(streamer, True)
-                    if old_status != new_status:
-                        status = "enabled" if new_status else "disabled"
-                        status_changed.append(f"{streamer}({status})")
+                kept = old_streamers & new_streamers
+                status_changed = [f"{streamer}(enabled)" for streamer in (new_enabled - old_enabled) & kept]
+                status_changed += [f"{streamer}(disabled)" for streamer in (old_enabled - new_enabled) & kept]
 
                 if added:
                     self.logger.info(f"➕ Added streamers: {', '.join(added)}")
                 if removed:
                     self.logger.info(f"➖ Removed streamers: {', '.join(removed)}")
                     # Stop any active recordings for removed streamers
-                    for streamer_key in removed:
-                        username = f"@{streamer_key}"  # Assuming format
-                        if username in self.active_recordings:
-                            asyncio.create_task(self.stop_recording(username, "removed_from_config"))
+                    removed_recordings = list({f"@{streamer_key}" for streamer_key in removed}  # Assuming format
+                                              & self.active_recordings.keys())
+                    if removed_recordings:
+                        self.spawn(self.stop_recordings(removed_recordings, "removed_from_config"),
+                                   cancel_on_shutdown=False)
                 if status_changed:
                     self.logger.info(f"🔄 Status changed: {', '.join(status_changed)}")
 
-                total_enabled = len([s for s in self.config['streamers'].values() if s.get('enabled', True)])
-                self.logger.info(f"📋 Now monitoring {total_enabled} streamers")
+                self.logger.info(f"📋 Now monitoring {self._enabled_count} streamers")
 
                 return True
 
@@ -401,25 +817,74 @@ class StreamMonitor:
                 "min_action_cooldown_seconds": 90,  # Minimum time between actions
                 "disconnect_confirmation_delay_seconds": 30,  # Time to wait before confirming disconnect
                 "individual_check_timeout": 20,  # Timeout per streamer check
-                "max_retries": 2  # Number of retries per check
+                "max_retries": 2,  # Number of retries per check
+                "max_parallel_checks": 32,  # Live checks allowed in flight at once
+                "max_offline_backoff": 10,  # Offline streamers are checked at most this many intervals apart
+                "event_format": "csv"  # Event log format: "csv", "jsonl" or "parquet"
             }
         }
 
-        config_path = Path(self.config_file)
+        config_path = self.config_file
         if config_path.exists():
             try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return _json_loads(config_path.read_bytes())
             except Exception as e:
                 self.logger.error(f"Error loading config: {e}")
                 return default_config
         else:
             # Create default config file
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(default_config, f, indent=2, ensure_ascii=False)
+            write_file_atomically(config_path, _json_dumps(default_config))
             self.logger.info(f"Created default config file: {config_path}")
             return default_config
 
+    def rebuild_caches(self):
+        """Precompute per-streamer lookups; call again whenever the config changes"""
+        # Live checks rely on the sign server being whitelisted for authenticated sessions
+        whitelist_host = self.config['settings'].get('whitelist_sign_server', 'tiktok.eulerstream.com')
+        os.environ['WHITELIST_AUTHENTICATED_SESSION_ID_HOST'] = whitelist_host
+
+        self._streamer_by_username = {f"@{key}": value for key, value in self.config['streamers'].items()}
+        self._streamer_cache = {
+            username: self._resolve_streamer_settings(streamer_config)
+            for username, streamer_config in self._streamer_by_username.items()
+        }
+        self._enabled_streamers = {}
+        for key, value in self.config['streamers'].items():
+            if not value.get('enabled', True):
+                continue
+            if not value.get('username'):
+                self.logger.warning(f"⚠️  Skipping streamer '{key}': no username in config")
+                continue
+            self._enabled_streamers[key] = value
+        self._enabled_count = len(self._enabled_streamers)
+        # Heap of (due time, streamer key); an entry is stale once _next_check moved on
+        self._schedule = [
+            (self._next_check.get(value.get('username'), 0), key) for key, value in self._enabled_streamers.items()
+        ]
+        heapq.heapify(self._schedule)
+
+    def _resolve_streamer_settings(self, streamer_config: dict) -> tuple:
+        settings = self.config['settings']
+        return (
+            streamer_config.get('session_id') or settings.get('session_id'),
+            streamer_config.get('tt_target_idc') or settings.get('tt_target_idc'),
+            ';'.join(streamer_config.get('tags', [])),
+            streamer_config.get('notes', '')
+        )
+
+    def get_streamer_config(self, username: str) -> dict:
+        streamer_config = self._streamer_by_username.get(username)
+        if streamer_config is None:
+            streamer_config = self.config['streamers'].get(username.replace('@', ''), {})
+        return streamer_config
+
+    def get_streamer_settings(self, username: str) -> tuple:
+        """(session_id, tt_target_idc, tags, notes) for a streamer, with global fallbacks applied"""
+        cached = self._streamer_cache.get(username)
+        if cached is None:
+            cached = self._resolve_streamer_settings(self.get_streamer_config(username))
+        return cached
+
     def init_session_log(self):
         """Initialize the session monitoring log CSV"""
         if not self.session_log_file.exists():
@@ -431,31 +896,102 @@ class StreamMonitor:
                     'joins_count', 'likes_count', 'tags', 'notes', 'error_message'
                 ])
 
+        # Kept open for the whole run; line buffering still puts each event on disk right away
+        self._session_log_handle = open(self.session_log_file, 'a', newline='', encoding='utf-8', buffering=1)
+        self._session_log_writer = csv.writer(self._session_log_handle)
+
     def log_session_event(self, username: str, action: str, status: str = 'success',
-                         duration_minutes: float = 0, stats: dict = None,
-                         error_message: str = ''):
-        """Log monitoring events to CSV"""
+                          duration_minutes: float = 0, stats: dict = None,
+                          error_message: str = '', streamer_settings: tuple = None):
+        """Log monitoring events to CSV; the row is queued for the I/O thread and written in order"""
         stats = stats or {}
-        streamer_config = self.config['streamers'].get(username.replace('@', ''), {})
+        _, _, tags, notes = streamer_settings or self.get_streamer_settings(username)
+
+        row = [
+            datetime.now().isoformat(),
+            username,
+            action,
+            status,
+            round(duration_minutes, 2),
+            stats.get('comments', 0),
+            stats.get('gifts', 0),
+            stats.get('follows', 0),
+            stats.get('shares', 0),
+            stats.get('joins', 0),
+            stats.get('likes', 0),
+            tags,
+            notes,
+            error_message
+        ]
 
-        with open(self.session_log_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                datetime.now().isoformat(),
-                username,
-                action,
-                status,
-                round(duration_minutes, 2),
-                stats.get('comments', 0),
-                stats.get('gifts', 0),
-                stats.get('follows', 0),
-                stats.get('shares', 0),
-                stats.get('joins', 0),
-                stats.get('likes', 0),
-                ';'.join(streamer_config.get('tags', [])),
-                streamer_config.get('notes', ''),
-                error_message
-            ])
+        self._io_executor.submit(self._write_session_row, row)
+
+    def _write_session_row(self, row: list):
+        try:
+            self._session_log_writer.writerow(row)
+        except Exception as e:
+            self.logger.error(f"Error writing session log: {e}")
+
+    def get_probe_client(self, username: str) -> TikTokLiveClient:
+        """Return the live-check client for this streamer's credentials, creating it on first use"""
+        session_id, tt_target_idc, _, _ = self.get_streamer_settings(username)
+        credentials = (session_id, tt_target_idc)
+
+        client = self._probe_clients.get(credentials)
+        if client is None:
+            # Streamers sharing a session share one client, and with it one
+            # pooled httpx connection to TikTok kept alive between polls
+            keepalive = self.config['settings']['check_interval_seconds'] * 2
+            client = TikTokLiveClient(
+                unique_id=username,
+                web_kwargs={'httpx_kwargs': {
+                    'http2': HTTP2_AVAILABLE,
+                    'limits': httpx.Limits(
+                        max_keepalive_connections=self.config['settings'].get('max_parallel_checks', 32),
+                        keepalive_expiry=keepalive,
+                    ),
+                }},
+            )
+            if session_id:
+                client.web.set_session(session_id, tt_target_idc)
+            self._probe_clients[credentials] = client
+        return client
+
+    def spawn(self, coro, cancel_on_shutdown: bool = True) -> asyncio.Task:
+        """Run a coroutine in the background, holding a reference until it is done and logging its failure"""
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        if cancel_on_shutdown:
+            self._cancellable_tasks.add(task)
+        task.add_done_callback(self._background_task_done)
+        return task
+
+    def _background_task_done(self, task: asyncio.Task):
+        self._background_tasks.discard(task)
+        self._cancellable_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error("Background task failed", exc_info=task.exception())
+
+    def discard_probe_clients(self):
+        """Drop all cached probe clients, e.g. after the config changed"""
+        clients = list(self._probe_clients.values())
+        self._probe_clients.clear()
+        if clients:
+            self._close_clients_later(clients)
+
+    def _close_clients_later(self, clients: list):
+        self.spawn(self.close_probe_clients(clients), cancel_on_shutdown=False)
+
+    async def close_probe_clients(self, clients: Optional[list] = None):
+        """Close the HTTP sessions of probe clients (all cached ones by default)"""
+        if clients is None:
+            clients = list(self._probe_clients.values())
+            self._probe_clients.clear()
+        for client in clients:
+            try:
+                await client.web.close()
+            except Exception as e:
+                self.logger.debug("Error closing probe client: %s", e)
 
     async def check_streamer_status(self, username: str) -> bool:
         """Check if a streamer is currently live with enhanced error handling"""
@@ -464,93 +1000,112 @@ class StreamMonitor:
 
         for attempt in range(max_retries + 1):
             try:
-                # Ensure environment variable is set for authenticated sessions
-                whitelist_host = self.config['settings'].get('whitelist_sign_server', 'tiktok.eulerstream.com')
-                os.environ['WHITELIST_AUTHENTICATED_SESSION_ID_HOST'] = whitelist_host
-
-                client = TikTokLiveClient(unique_id=username)
-
-                # Set session ID if available
-                streamer_config = self.config['streamers'].get(username.replace('@', ''), {})
-                session_id = streamer_config.get('session_id') or self.config['settings'].get('session_id')
-                tt_target_idc = streamer_config.get('tt_target_idc') or self.config['settings'].get('tt_target_idc')
-
-                if session_id:
-                    client.web.set_session(session_id, tt_target_idc)
+                client = self.get_probe_client(username)
 
                 # Check with timeout
-                is_live = await asyncio.wait_for(client.is_live(), timeout=timeout)
+                is_live = await asyncio.wait_for(client.is_live(unique_id=username), timeout=timeout)
 
                 if attempt > 0:  # Log successful retry
-                    self.logger.debug(f"✅ Status check succeeded for {username} on attempt {attempt + 1}")
+                    self.logger.debug("✅ Status check succeeded for %s on attempt %s", username, attempt + 1)
 
                 return is_live
 
             except asyncio.TimeoutError:
                 if attempt < max_retries:
-                    self.logger.debug(f"⏱️ Timeout checking {username}, retrying... (attempt {attempt + 1}/{max_retries + 1})")
+                    self.logger.debug("⏱️ Timeout checking %s, retrying... (attempt %s/%s)", username, attempt + 1, max_retries + 1)
                     await asyncio.sleep(3 + attempt)  # Progressive backoff
                     continue
                 else:
-                    self.logger.debug(f"⏱️ Final timeout checking {username} after {max_retries + 1} attempts")
+                    self.logger.debug("⏱️ Final timeout checking %s after %s attempts", username, max_retries + 1)
                     return False
             except Exception as e:
                 if attempt < max_retries:
-                    self.logger.debug(f"⚠️ Error checking {username}: {e}, retrying... (attempt {attempt + 1}/{max_retries + 1})")
+                    self.logger.debug("⚠️ Error checking %s: %s, retrying... (attempt %s/%s)", username, e, attempt + 1, max_retries + 1)
                     await asyncio.sleep(3 + attempt)  # Progressive backoff
                     continue
                 else:
-                    self.logger.debug(f"❌ Final error checking {username}: {e}")
+                    self.logger.debug("❌ Final error checking %s: %s", username, e)
                     return False
 
         return False
 
-    async def check_all_streamers_parallel(self, enabled_streamers: dict) -> dict:
-        """Check all streamers in parallel with improved error handling"""
+    async def check_recorded_rooms(self, usernames: List[str]) -> Dict[str, bool]:
+        """Check the rooms of streamers being recorded with a single check_alive request"""
+        room_ids = {}
+        for username in usernames:
+            room_id = getattr(self.active_recordings[username]['client'], 'room_id', None)
+            if room_id:
+                room_ids[username] = room_id
+        if not room_ids:
+            return {}
+
         timeout = self.config['settings'].get('individual_check_timeout', 20)
+        client = self.get_probe_client(next(iter(room_ids)))
+        try:
+            alive = await asyncio.wait_for(
+                client.web.fetch_is_live.fetch_is_live_room_ids(*room_ids.values()), timeout=timeout)
+        except Exception as e:
+            # Falls back to one check per streamer
+            self.logger.debug("Bulk room check failed: %s", e)
+            return {}
+        if len(alive) != len(room_ids):
+            return {}
+        return dict(zip(room_ids, alive))
+
+    async def iter_streamer_status(self, enabled_streamers: dict):
+        """Check all streamers in parallel, yielding (username, is_live) as each check finishes"""
+        timeout = self.config['settings'].get('individual_check_timeout', 20)
+        if self._check_semaphore is None:
+            self._check_semaphore = asyncio.Semaphore(self.config['settings'].get('max_parallel_checks', 32))
 
         async def check_single_streamer_with_timeout(streamer_key: str, streamer_config: dict):
             username = streamer_config['username']
             try:
-                # Use individual timeout per streamer
-                is_live = await asyncio.wait_for(
-                    self.check_streamer_status(username),
-                    timeout=timeout + 5  # Add buffer to individual timeout
-                )
+                # Time spent waiting for a slot doesn't count towards the timeout
+                async with self._check_semaphore:
+                    # Use individual timeout per streamer
+                    is_live = await asyncio.wait_for(
+                        self.check_streamer_status(username),
+                        timeout=timeout + 5  # Add buffer to individual timeout
+                    )
                 return username, is_live
             except asyncio.TimeoutError:
-                self.logger.debug(f"Individual timeout for {username}")
+                self.logger.debug("Individual timeout for %s", username)
                 return username, False
             except Exception as e:
-                self.logger.debug(f"Error in parallel check for {username}: {e}")
+                self.logger.debug("Error in parallel check for %s: %s", username, e)
                 return username, False
 
         # Create tasks for all streamers
         tasks = [
-            check_single_streamer_with_timeout(streamer_key, streamer_config)
+            asyncio.ensure_future(check_single_streamer_with_timeout(streamer_key, streamer_config))
             for streamer_key, streamer_config in enabled_streamers.items()
         ]
 
-        live_status = {}
-
         try:
-            # Run all tasks in parallel
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results
-            for result in results:
-                if isinstance(result, tuple):
-                    username, is_live = result
-                    live_status[username] = is_live
-                elif isinstance(result, Exception):
-                    self.logger.debug(f"Task exception: {result}")
-
-            return live_status
-
-        except Exception as e:
-            self.logger.warning(f"⚠️ Error in parallel checking: {e}")
-            # Return False for any streamers we couldn't check
-            return {config['username']: False for config in enabled_streamers.values()}
+            # A fast answer is handled right away instead of waiting for the slowest check
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def ensure_output_dir(self) -> Path:
+        """Return the output directory, creating it the first time it is used"""
+        output_dir = Path(self.config['settings']['output_directory'])
+        if output_dir not in self._created_dirs:
+            await self._loop.run_in_executor(
+                None, functools.partial(output_dir.mkdir, parents=True, exist_ok=True))
+            self._created_dirs.add(output_dir)
+        return output_dir
+
+    async def stop_recordings(self, usernames: List[str], reason: str):
+        """Stop several recordings side by side, logging any that fail"""
+        results = await asyncio.gather(*(self.stop_recording(username, reason) for username in usernames),
+                                       return_exceptions=True)
+        for username, result in zip(usernames, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error stopping recording for {username}: {result}")
 
     async def start_recording(self, username: str):
         """Start recording a streamer"""
@@ -561,13 +1116,13 @@ class StreamMonitor:
         if len(self.active_recordings) >= self.config['settings']['max_concurrent_recordings']:
             self.logger.warning(f"Max concurrent recordings reached. Skipping {username}")
             self.log_session_event(username, 'recording_attempt', 'failed',
-                                 error_message='Max concurrent recordings reached')
+                           error_message='Max concurrent recordings reached')
             return
 
         # Check file descriptor usage before starting
         open_files = self.get_open_file_count()
         if open_files > 0:
-            self.logger.debug(f"Current open file descriptors: {open_files}")
+            self.logger.debug("Current open file descriptors: %s", open_files)
             if open_files > 200:  # Warning threshold
                 self.logger.warning(f"⚠️  High number of open files ({open_files}). May be approaching system limits.")
 
@@ -575,46 +1130,53 @@ class StreamMonitor:
         try:
             self.logger.info(f"🔴 Starting recording for {username}")
 
-            # Ensure environment variable is set for authenticated sessions
-            whitelist_host = self.config['settings'].get('whitelist_sign_server', 'tiktok.eulerstream.com')
-            os.environ['WHITELIST_AUTHENTICATED_SESSION_ID_HOST'] = whitelist_host
-            self.logger.debug(f"🔐 Environment variable set: WHITELIST_AUTHENTICATED_SESSION_ID_HOST={whitelist_host}")
-
             # Create client
             client = TikTokLiveClient(unique_id=username)
 
             # Set session ID if available
-            streamer_config = self.config['streamers'].get(username.replace('@', ''), {})
-            session_id = streamer_config.get('session_id') or self.config['settings'].get('session_id')
-            tt_target_idc = streamer_config.get('tt_target_idc') or self.config['settings'].get('tt_target_idc')
+            streamer_config = self.get_streamer_config(username)
+            streamer_settings = self.get_streamer_settings(username)
+            session_id, tt_target_idc, _, _ = streamer_settings
 
             if session_id:
                 client.web.set_session(session_id, tt_target_idc)
-                self.logger.debug(f"🔑 Session ID configured for {username}")
+                self.logger.debug("🔑 Session ID configured for %s", username)
 
             # Set up file paths using Path for cross-platform compatibility
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             username_clean = username.replace("@", "")
-            output_dir = Path(self.config['settings']['output_directory'])
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            # Create CSV files
-            csv_files = {
-                'comments': output_dir / f"{username_clean}_{timestamp}_comments.csv",
-                'gifts': output_dir / f"{username_clean}_{timestamp}_gifts.csv",
-                'follows': output_dir / f"{username_clean}_{timestamp}_follows.csv",
-                'shares': output_dir / f"{username_clean}_{timestamp}_shares.csv",
-                'joins': output_dir / f"{username_clean}_{timestamp}_joins.csv",
-                'likes': output_dir / f"{username_clean}_{timestamp}_likes.csv"
-            }
+            output_dir = await self.ensure_output_dir()
+
+            # Create CSV (or JSONL) files
+            event_format = self.config['settings'].get('event_format', 'csv')
+            if event_format not in EVENT_FORMATS:
+                event_format = 'csv'
+            if event_format == 'parquet' and not PARQUET_AVAILABLE:
+                self.logger.warning("⚠️  event_format 'parquet' needs pyarrow; writing CSV files instead")
+                event_format = 'csv'
+            if event_format == 'parquet':
+                # All event types go into one file, told apart by its event_type column
+                events_file = output_dir / f"{username_clean}_{timestamp}_events.parquet"
+                csv_files = {csv_type: events_file for csv_type in CSV_HEADERS}
+            else:
+                csv_files = {
+                    csv_type: output_dir / f"{username_clean}_{timestamp}_{csv_type}.{event_format}"
+                    for csv_type in CSV_HEADERS
+                }
 
-            # Initialize CSV files and keep file handles open
-            csv_writers = self.init_csv_files_with_handles(csv_files)
+            # Event CSVs are opened lazily, so rare event types don't hold a descriptor
+            csv_writers = self.init_csv_files(csv_files, event_format)
 
             # Store recording info
             recording_info = {
                 'client': client,
+                'streamer_config': streamer_config,
+                'streamer_settings': streamer_settings,  # (session_id, tt_target_idc, tags, notes)
                 'start_time': datetime.now(),
+                'start_monotonic': time.monotonic(),  # For the duration, unaffected by clock changes
+                'timestamp': timestamp,  # Shared by the CSV and video file names
+                'username_clean': username_clean,
+                'output_dir': output_dir,
                 'csv_files': csv_files,
                 'csv_writers': csv_writers,  # Keep file handles and writers
                 'stats': {'comments': 0, 'gifts': 0, 'follows': 0, 'shares': 0, 'joins': 0, 'likes': 0},
@@ -628,7 +1190,7 @@ class StreamMonitor:
             await client.start(fetch_room_info=True)
             self.active_recordings[username] = recording_info
 
-            self.log_session_event(username, 'recording_started', 'success')
+            self.log_session_event(username, 'recording_started', 'success', streamer_settings=streamer_settings)
             self.logger.info(f"✅ Successfully started recording {username}")
 
         except Exception as e:
@@ -636,68 +1198,144 @@ class StreamMonitor:
 
             # Clean up any partially opened files
             if csv_writers:
-                self.logger.debug(f"Cleaning up partially opened files for {username}")
+                self.logger.debug("Cleaning up partially opened files for %s", username)
                 for csv_type, csv_info in csv_writers.items():
                     try:
                         if 'file_handle' in csv_info and csv_info['file_handle'] and not csv_info['file_handle'].closed:
                             csv_info['file_handle'].close()
                     except Exception as cleanup_error:
-                        self.logger.debug(f"Error during cleanup of {csv_type}: {cleanup_error}")
+                        self.logger.debug("Error during cleanup of %s: %s", csv_type, cleanup_error)
 
             self.log_session_event(username, 'recording_started', 'failed',
-                                 error_message=str(e))
-
-    def init_csv_files_with_handles(self, csv_files: dict) -> dict:
-        """Initialize CSV files with headers and return open file handles with writers"""
-        headers = {
-            'comments': ['timestamp', 'user_id', 'nickname', 'comment', 'follower_count'],
-            'gifts': ['timestamp', 'user_id', 'nickname', 'gift_name', 'repeat_count', 'streakable', 'streaking'],
-            'follows': ['timestamp', 'user_id', 'nickname', 'follow_count', 'share_type', 'action'],
-            'shares': ['timestamp', 'user_id', 'nickname', 'share_type', 'share_target', 'share_count', 'users_joined', 'action'],
-            'joins': ['timestamp', 'user_id', 'nickname', 'count', 'is_top_user', 'enter_type', 'action', 'user_share_type', 'client_enter_source'],
-            'likes': ['timestamp', 'user_id', 'nickname', 'count', 'total', 'color', 'effect_cnt']
-        }
+                           error_message=str(e))
+
+    def init_csv_files(self, csv_files: dict, event_format: str = 'csv') -> dict:
+        """Set up the per-type event buffers; each file is only opened once it has rows to write"""
+        if event_format == 'parquet':
+            sinks = {filepath: ParquetEventFile(filepath) for filepath in set(csv_files.values())}
+            return {
+                csv_type: {
+                    'path': filepath,
+                    'parquet': sinks[filepath],
+                    'format_rows': functools.partial(format_parquet_rows, csv_type, CSV_HEADERS[csv_type]),
+                    'file_handle': None,
+                    'lines': []
+                }
+                for csv_type, filepath in csv_files.items()
+            }
 
-        csv_writers = {}
-        opened_files = []  # Track opened files for cleanup on error
+        jsonl = event_format == 'jsonl'
+        return {
+            csv_type: {
+                'path': filepath,
+                'header': b'' if jsonl else CSV_HEADER_LINES[csv_type],
+                'format_rows': (functools.partial(format_jsonl_rows, CSV_HEADERS[csv_type]) if jsonl
+                                else format_csv_rows),
+                'file_handle': None,  # Opened by the I/O thread on first write
+                'lines': []
+            }
+            for csv_type, filepath in csv_files.items()
+        }
 
-        try:
-            for csv_type, filepath in csv_files.items():
-                # Open file and create writer
-                file_handle = open(filepath, 'w', newline='', encoding='utf-8')
-                opened_files.append(file_handle)  # Track for cleanup
-                writer = csv.writer(file_handle)
-                writer.writerow(headers[csv_type])
-
-                # Store both file handle and writer for proper cleanup
-                csv_writers[csv_type] = {
-                    'file_handle': file_handle,
-                    'writer': writer
-                }
-        except Exception as e:
-            # Clean up any files we managed to open
-            self.logger.error(f"Error opening CSV files, cleaning up opened files: {e}")
-            for file_handle in opened_files:
+    def buffer_event_row(self, csv_info: dict, fields: tuple):
+        """Queue an event's fields (everything after the timestamp column), draining the buffer once it is large enough"""
+        lines = csv_info['lines']
+        lines.append((time.time_ns(), fields))
+        if len(lines) >= CSV_FLUSH_ROWS:
+            self.drain_csv_buffer(csv_info)
+
+    def drain_csv_buffer(self, csv_info: dict):
+        """Hand buffered rows to the I/O thread; returns the write's future, if any"""
+        lines = csv_info['lines']
+        if not lines:
+            return None
+        csv_info['lines'] = []
+        future = self._io_executor.submit(self._write_csv_lines, csv_info, lines)
+        # Most callers don't wait for the write, so a failed batch is reported here
+        future.add_done_callback(functools.partial(self._csv_batch_written, csv_info['path'], len(lines)))
+        return future
+
+    def _csv_batch_written(self, path: Path, row_count: int, future):
+        if not future.cancelled() and future.exception() is not None:
+            self.logger.error(f"Error writing {row_count} rows to {path.name}: {future.exception()}")
+
+    @staticmethod
+    def _open_csv_file(csv_info: dict):
+        if 'parquet' in csv_info:
+            csv_info['file_handle'] = csv_info['parquet']
+            return csv_info['file_handle']
+        # Binary handles: rows are encoded in one go per batch on the I/O thread
+        file_handle = open(csv_info['path'], 'wb', buffering=CSV_BUFFER_SIZE)
+        file_handle.write(csv_info['header'])
+        csv_info['file_handle'] = file_handle
+        return file_handle
+
+    @classmethod
+    def _write_csv_lines(cls, csv_info: dict, lines: List[tuple]):
+        file_handle = csv_info['file_handle'] or cls._open_csv_file(csv_info)
+        file_handle.write(csv_info['format_rows'](lines))
+        file_handle.flush()
+
+    @classmethod
+    def _close_csv_file(cls, csv_info: dict):
+        # Event types that never fired still get their header-only CSV
+        file_handle = csv_info['file_handle'] or cls._open_csv_file(csv_info)
+        if file_handle.closed:
+            return
+        if 'parquet' not in csv_info:  # The Parquet sink syncs itself once its footer is written
+            file_handle.flush()
+            os.fsync(file_handle.fileno())
+        file_handle.close()
+
+    async def flush_event_buffers(self):
+        """Periodically drain the event buffers of all active recordings in a single pass"""
+        next_cache_drop = time.monotonic() + VIDEO_CACHE_DROP_INTERVAL_SECONDS
+        while True:
+            await asyncio.sleep(CSV_FLUSH_INTERVAL_SECONDS)
+            # stop_recording drains its own buffers once is_recording is cleared
+            recordings = [info for info in self.active_recordings.values() if info.get('is_recording', False)]
+            pending = []
+            for recording_info in recordings:
+                for csv_type, csv_info in recording_info['csv_writers'].items():
+                    future = self.drain_csv_buffer(csv_info)
+                    if future is not None:
+                        pending.append((csv_type, future))
+            for csv_type, future in pending:
                 try:
-                    file_handle.close()
-                except:
-                    pass
-            raise  # Re-raise the original exception
-
-        return csv_writers
+                    await asyncio.wrap_future(future)
+                except Exception:
+                    pass  # Logged by _csv_batch_written
+
+            now = time.monotonic()
+            if hasattr(os, 'posix_fadvise') and now >= next_cache_drop:
+                next_cache_drop = now + VIDEO_CACHE_DROP_INTERVAL_SECONDS
+                await asyncio.gather(*(self.drop_video_cache(info) for info in recordings))
+
+    async def drop_video_cache(self, recording_info: dict):
+        """Release page cache held by the part of the video ffmpeg has already written"""
+        video_file = recording_info.get('video_file')
+        if not video_file:
+            return
+        try:
+            recording_info['video_cache_offset'] = await self._loop.run_in_executor(
+                None, drop_video_page_cache, video_file, recording_info.get('video_cache_offset', 0))
+        except OSError as e:
+            self.logger.debug("Could not drop video page cache for %s: %s", video_file, e)
 
     def setup_event_handlers(self, client: TikTokLiveClient, username: str, recording_info: dict):
         """Set up event handlers for the client"""
+        # Bound once here rather than looked up on every chat/like/join event;
+        # handlers check is_recording before touching them
+        stats = recording_info['stats']
+        csv_writers = recording_info['csv_writers']
+        buffer_event_row = self.buffer_event_row
 
         @client.on(ConnectEvent)
         async def on_connect(event: ConnectEvent):
             self.logger.info(f"📡 Connected to {username}'s stream (Room: {client.room_id})")
 
             # Start video recording with error handling
-            timestamp = recording_info['start_time'].strftime("%Y%m%d_%H%M%S")
-            username_clean = username.replace("@", "")
-            output_dir = Path(self.config['settings']['output_directory'])
-            video_file = output_dir / f"{username_clean}_{timestamp}.mp4"
+            video_file = recording_info['output_dir'] / f"{recording_info['username_clean']}_{recording_info['timestamp']}.mp4"
 
             try:
                 # Ensure the video recording starts properly
@@ -720,7 +1358,7 @@ class StreamMonitor:
             # Cancel any pending disconnect confirmations
             if username in self.pending_disconnects:
                 del self.pending_disconnects[username]
-                self.logger.debug(f"Cancelled pending disconnect confirmation for {username}")
+                self.logger.debug("Cancelled pending disconnect confirmation for %s", username)
             # Immediately stop recording when we get the official stream end event
             await self.stop_recording(username, "live_end_event")
 
@@ -732,9 +1370,9 @@ class StreamMonitor:
             if username not in self.pending_disconnects:
                 self.pending_disconnects[username] = {
                     'timestamp': datetime.now(),
-                    'task': asyncio.create_task(self.handle_disconnect_confirmation(username))
+                    'task': self.spawn(self.handle_disconnect_confirmation(username))
                 }
-                self.logger.debug(f"Started disconnect confirmation for {username}")
+                self.logger.debug("Started disconnect confirmation for %s", username)
 
         @client.on(CommentEvent)
         async def on_comment(event: CommentEvent):
@@ -742,20 +1380,12 @@ class StreamMonitor:
             if not recording_info.get('is_recording', False):
                 return
 
-            timestamp_now = datetime.now().isoformat()
-            recording_info['stats']['comments'] += 1
+            stats['comments'] += 1
 
             try:
-                writer = recording_info['csv_writers']['comments']['writer']
-                writer.writerow([
-                    timestamp_now,
-                    getattr(event.user, 'unique_id', ''),
-                    getattr(event.user, 'nickname', ''),
-                    event.comment,
-                    getattr(event.user, 'follower_count', 0)
-                ])
-                # Flush to ensure data is written immediately
-                recording_info['csv_writers']['comments']['file_handle'].flush()
+                user_id, nickname, comment, follower_count = comment_fields(event)
+                buffer_event_row(csv_writers['comments'],
+                                 (user_id, nickname, comment, follower_count))
             except Exception as e:
                 if recording_info.get('is_recording', False):  # Only log if we should still be recording
                     self.logger.error(f"Error writing comment event: {e}")
@@ -766,21 +1396,12 @@ class StreamMonitor:
             if not recording_info.get('is_recording', False):
                 return
 
-            timestamp_now = datetime.now().isoformat()
-            recording_info['stats']['gifts'] += 1
+            stats['gifts'] += 1
 
             try:
-                writer = recording_info['csv_writers']['gifts']['writer']
-                writer.writerow([
-                    timestamp_now,
-                    getattr(event.user, 'unique_id', ''),
-                    getattr(event.user, 'nickname', ''),
-                    event.gift.name,
-                    event.repeat_count,
-                    event.gift.streakable,
-                    event.streaking
-                ])
-                recording_info['csv_writers']['gifts']['file_handle'].flush()
+                user_id, nickname, gift_name, repeat_count, streakable, streaking = gift_fields(event)
+                buffer_event_row(csv_writers['gifts'],
+                                 (user_id, nickname, gift_name, repeat_count, streakable, streaking))
             except Exception as e:
                 if recording_info.get('is_recording', False):  # Only log if we should still be recording
                     self.logger.error(f"Error writing gift event: {e}")
@@ -791,20 +1412,12 @@ class StreamMonitor:
             if not recording_info.get('is_recording', False):
                 return
 
-            timestamp_now = datetime.now().isoformat()
-            recording_info['stats']['follows'] += 1
+            stats['follows'] += 1
 
             try:
-                writer = recording_info['csv_writers']['follows']['writer']
-                writer.writerow([
-                    timestamp_now,
-                    getattr(event.user, 'unique_id', ''),
-                    getattr(event.user, 'nickname', ''),
-                    getattr(event, 'follow_count', 0),
-                    getattr(event, 'share_type', 0),
-                    getattr(event, 'action', 0)
-                ])
-                recording_info['csv_writers']['follows']['file_handle'].flush()
+                user_id, nickname, follow_count, share_type, action = follow_fields(event)
+                buffer_event_row(csv_writers['follows'],
+                                 (user_id, nickname, follow_count, share_type, action))
             except Exception as e:
                 if recording_info.get('is_recording', False):  # Only log if we should still be recording
                     self.logger.error(f"Error writing follow event: {e}")
@@ -815,22 +1428,13 @@ class StreamMonitor:
             if not recording_info.get('is_recording', False):
                 return
 
-            timestamp_now = datetime.now().isoformat()
-            recording_info['stats']['shares'] += 1
+            stats['shares'] += 1
 
             try:
-                writer = recording_info['csv_writers']['shares']['writer']
-                writer.writerow([
-                    timestamp_now,
-                    getattr(event.user, 'unique_id', ''),
-                    getattr(event.user, 'nickname', ''),
-                    getattr(event, 'share_type', 0),
-                    getattr(event, 'share_target', 'unknown'),
-                    getattr(event, 'share_count', 0),
-                    getattr(event, 'users_joined', 0) or 0,
-                    getattr(event, 'action', 0)
-                ])
-                recording_info['csv_writers']['shares']['file_handle'].flush()
+                user_id, nickname, share_type, share_target, share_count, users_joined, action = share_fields(event)
+                buffer_event_row(csv_writers['shares'],
+                                 (user_id, nickname, share_type, share_target, share_count,
+                                  users_joined or 0, action))
             except Exception as e:
                 if recording_info.get('is_recording', False):  # Only log if we should still be recording
                     self.logger.error(f"Error writing share event: {e}")
@@ -841,23 +1445,14 @@ class StreamMonitor:
             if not recording_info.get('is_recording', False):
                 return
 
-            timestamp_now = datetime.now().isoformat()
-            recording_info['stats']['joins'] += 1
+            stats['joins'] += 1
 
             try:
-                writer = recording_info['csv_writers']['joins']['writer']
-                writer.writerow([
-                    timestamp_now,
-                    getattr(event.user, 'unique_id', ''),
-                    getattr(event.user, 'nickname', ''),
-                    getattr(event, 'count', 0),
-                    getattr(event, 'is_top_user', False),
-                    getattr(event, 'enter_type', 0),
-                    getattr(event, 'action', 0),
-                    getattr(event, 'user_share_type', ''),
-                    getattr(event, 'client_enter_source', '')
-                ])
-                recording_info['csv_writers']['joins']['file_handle'].flush()
+                (user_id, nickname, count, is_top_user, enter_type, action,
+                 user_share_type, client_enter_source) = join_fields(event)
+                buffer_event_row(csv_writers['joins'],
+                                 (user_id, nickname, count, is_top_user, enter_type, action,
+                                  user_share_type, client_enter_source))
             except Exception as e:
                 if recording_info.get('is_recording', False):  # Only log if we should still be recording
                     self.logger.error(f"Error writing join event: {e}")
@@ -868,49 +1463,64 @@ class StreamMonitor:
             if not recording_info.get('is_recording', False):
                 return
 
-            timestamp_now = datetime.now().isoformat()
-            recording_info['stats']['likes'] += 1
+            stats['likes'] += 1
 
             try:
-                writer = recording_info['csv_writers']['likes']['writer']
-                writer.writerow([
-                    timestamp_now,
-                    getattr(event.user, 'unique_id', ''),
-                    getattr(event.user, 'nickname', ''),
-                    getattr(event, 'count', 0),
-                    getattr(event, 'total', 0),
-                    getattr(event, 'color', 0),
-                    getattr(event, 'effect_cnt', 0)
-                ])
-                recording_info['csv_writers']['likes']['file_handle'].flush()
+                user_id, nickname, count, total, color, effect_cnt = like_fields(event)
+                buffer_event_row(csv_writers['likes'],
+                                 (user_id, nickname, count, total, color, effect_cnt))
             except Exception as e:
                 if recording_info.get('is_recording', False):  # Only log if we should still be recording
                     self.logger.error(f"Error writing like event: {e}")
 
     async def stop_recording(self, username: str, reason: str = "manual"):
         """Stop recording a streamer with enhanced error handling"""
-        if username not in self.active_recordings:
-            self.logger.warning(f"No active recording found for {username}")
+        # A second stop for the same stream (LiveEndEvent racing a disconnect
+        # confirmation, or shutdown) waits for the teardown already under way
+        stopping = self._stopping.get(username)
+        if stopping is not None:
+            await asyncio.shield(stopping)
+            return
+
+        recording_info = self.active_recordings.get(username)
+        if recording_info is None:
+            self.logger.debug("No active recording found for %s", username)
             return
 
         # Cancel any pending disconnect confirmations
         if username in self.pending_disconnects:
             try:
-                self.pending_disconnects[username]['task'].cancel()
-                del self.pending_disconnects[username]
-                self.logger.debug(f"Cancelled pending disconnect confirmation for {username}")
+                task = self.pending_disconnects.pop(username)['task']
+                # The confirmation task itself may be the one stopping the recording
+                if task is not asyncio.current_task():
+                    task.cancel()
+                self.logger.debug("Cancelled pending disconnect confirmation for %s", username)
             except Exception as e:
-                self.logger.debug(f"Error cancelling disconnect confirmation: {e}")
+                self.logger.debug("Error cancelling disconnect confirmation: %s", e)
 
-        recording_info = self.active_recordings[username]
-        duration = (datetime.now() - recording_info['start_time']).total_seconds() / 60
+        # The teardown runs as its own task so a cancelled caller can't cut it short,
+        # and run() waits for it before shutting down the I/O executor
+        task = self.spawn(self._teardown_recording(username, recording_info, reason), cancel_on_shutdown=False)
+        self._stopping[username] = task
+        await asyncio.shield(task)
+
+    async def _teardown_recording(self, username: str, recording_info: dict, reason: str):
+        try:
+            await self._finish_recording(username, recording_info, reason)
+        finally:
+            # Only now may the streamer be recorded again
+            self.active_recordings.pop(username, None)
+            self._stopping.pop(username, None)
+
+    async def _finish_recording(self, username: str, recording_info: dict, reason: str):
+        duration = (time.monotonic() - recording_info['start_monotonic']) / 60
 
         try:
             client = recording_info['client']
 
             # Mark recording as stopped to prevent new events from writing
             recording_info['is_recording'] = False
-            self.logger.debug(f"Marked recording as stopped for {username}")
+            self.logger.debug("Marked recording as stopped for %s", username)
 
             # Stop video recording properly with enhanced error handling
             if hasattr(client.web, 'fetch_video_data'):
@@ -924,8 +1534,16 @@ class StreamMonitor:
 
                         # Check if video file exists and has content
                         video_file = recording_info.get('video_file')
-                        if video_file and Path(video_file).exists():
-                            file_size = Path(video_file).stat().st_size / (1024 * 1024)  # MB
+                        video_bytes = None
+                        if video_file:
+                            try:
+                                # Off the event loop; slow disks would stall other recordings
+                                video_bytes = await self._loop.run_in_executor(
+                                    None, release_video_file, video_file)
+                            except FileNotFoundError:
+                                pass
+                        if video_bytes is not None:
+                            file_size = video_bytes / (1024 * 1024)  # MB
                             self.logger.info(f"📁 Video file size: {file_size:.1f} MB")
 
                             if file_size < 0.1:  # Less than 100KB might indicate corruption
@@ -934,33 +1552,36 @@ class StreamMonitor:
                             self.logger.warning(f"⚠️  Video file not found: {video_file}")
 
                 except Exception as video_error:
-                    self.logger.debug(f"Error stopping video recording: {video_error}")
+                    self.logger.debug("Error stopping video recording: %s", video_error)
 
             # Disconnect client gracefully with timeout
             if hasattr(client, 'connected') and client.connected:
-                self.logger.debug(f"Disconnecting client for {username}")
+                self.logger.debug("Disconnecting client for %s", username)
                 try:
                     await asyncio.wait_for(client.disconnect(), timeout=10.0)
                 except asyncio.TimeoutError:
-                    self.logger.debug(f"Disconnect timeout for {username}")
+                    self.logger.debug("Disconnect timeout for %s", username)
                 except Exception as e:
-                    self.logger.debug(f"Disconnect error for {username}: {e}")
+                    self.logger.debug("Disconnect error for %s: %s", username, e)
 
                 # Give extra time for events to finish processing
                 await asyncio.sleep(2)
 
             # Close CSV file handles properly after disconnect
             if 'csv_writers' in recording_info:
-                self.logger.debug(f"Closing CSV files for {username}")
+                self.logger.debug("Closing CSV files for %s", username)
+                # Queue the last buffered rows of every type before any file is closed,
+                # since a Parquet file is shared by all of them
+                for csv_info in recording_info['csv_writers'].values():
+                    self.drain_csv_buffer(csv_info)
                 for csv_type, csv_info in recording_info['csv_writers'].items():
                     try:
-                        if csv_info['file_handle'] and not csv_info['file_handle'].closed:
-                            csv_info['file_handle'].close()
-                            self.logger.debug(f"Closed {csv_type} CSV file for {username}")
-                        else:
-                            self.logger.debug(f"{csv_type} CSV file already closed for {username}")
+                        # Make sure the rows hit the disk
+                        await self._loop.run_in_executor(
+                            self._io_executor, self._close_csv_file, csv_info)
+                        self.logger.debug("Closed %s CSV file for %s", csv_type, username)
                     except Exception as e:
-                        self.logger.debug(f"Error closing {csv_type} CSV file: {e}")
+                        self.logger.debug("Error closing %s CSV file: %s", csv_type, e)
                 # Clear the csv_writers to prevent double-closing
                 recording_info['csv_writers'] = {}
 
@@ -970,7 +1591,8 @@ class StreamMonitor:
                 f'recording_stopped_{reason}',
                 'success',
                 duration,
-                recording_info['stats']
+                recording_info['stats'],
+                streamer_settings=recording_info['streamer_settings']
             )
 
             self.logger.info(f"⏹️  Stopped recording {username} ({reason}) - Duration: {duration:.1f}m")
@@ -978,16 +1600,41 @@ class StreamMonitor:
 
         except Exception as e:
             self.logger.error(f"Error stopping recording for {username}: {e}")
-        finally:
-            # Ensure recording is removed from active list
-            if username in self.active_recordings:
-                del self.active_recordings[username]
+
+    def pop_due_streamers(self, now: float) -> dict:
+        """Take every enabled streamer whose next check is due off the schedule"""
+        due_streamers = {}
+        while self._schedule and self._schedule[0][0] <= now:
+            due, streamer_key = heapq.heappop(self._schedule)
+            streamer_config = self._enabled_streamers.get(streamer_key)
+            if streamer_config is not None and self._next_check.get(streamer_config['username'], 0) == due:
+                due_streamers[streamer_key] = streamer_config
+        return due_streamers
+
+    def schedule_next_checks(self, checked_streamers: dict, live_status: dict, now: float):
+        """Put checked streamers back on the schedule, backing off exponentially on those that keep being offline"""
+        base_interval = self.config['settings']['check_interval_seconds']
+        max_backoff = self.config['settings'].get('max_offline_backoff', 10)
+        for streamer_key, streamer_config in checked_streamers.items():
+            username = streamer_config['username']
+            is_live = live_status.get(username)
+            if is_live is None or is_live or username in self.active_recordings:
+                # Live, recording, or never answered: check again next cycle
+                self._offline_checks[username] = 0
+                next_check = now
+            else:
+                misses = self._offline_checks.get(username, 0) + 1
+                self._offline_checks[username] = misses
+                # Due slightly early so it lands in the cycle that reaches the deadline
+                next_check = now + base_interval * (min(2 ** (misses - 1), max_backoff) - 0.5)
+            self._next_check[username] = next_check
+            heapq.heappush(self._schedule, (next_check, streamer_key))
 
     async def monitor_streamers(self):
         """Main monitoring loop with enhanced stability tracking"""
         self.logger.info("🔍 Starting TikTok streamer monitor...")
         self.logger.info(f"🖥️  Platform: {platform.system()} {platform.release()}")
-        self.logger.info(f"📋 Monitoring {len([s for s in self.config['streamers'].values() if s.get('enabled', True)])} streamers")
+        self.logger.info(f"📋 Monitoring {self._enabled_count} streamers")
         self.logger.info(f"📊 Stability: {self.stability_threshold} consecutive checks, {self.min_action_cooldown}s cooldown")
         self.logger.info(f"🔌 Disconnect confirmation: {self.disconnect_confirmation_delay}s delay")
         self.logger.info("📄 Control files:")
@@ -999,10 +1646,32 @@ class StreamMonitor:
         check_count = 0
         self.update_status_file("monitoring", "Started monitoring loop")
 
+        # Interval settings, re-read only when the config is reloaded
+        base_interval = self.config['settings']['check_interval_seconds']
+        config_check_cycles = max(1, round(60 / base_interval))
+
+        # Smoothed check duration; the slow-cycle warning is logged once per slow spell
+        duration_ema = 0.0
+        slow_warned = False
+
         while self.monitoring:
             try:
                 # Check for config file changes first
-                config_changed = self.check_config_changes()
+                config_changed = False
+                self._config_check_counter += 1
+                if self._control_watch is not None:
+                    # inotify reports config edits, so look when it saw one, plus a slow fallback poll
+                    check_config = (self._config_dirty or
+                                    self._config_check_counter >= config_check_cycles * CONFIG_WATCH_FALLBACK_FACTOR)
+                else:
+                    check_config = self._config_check_counter >= config_check_cycles
+                if check_config:
+                    self._config_check_counter = 0
+                    self._config_dirty = False
+                    config_changed = await self.check_config_changes()
+                    if config_changed:
+                        base_interval = self.config['settings']['check_interval_seconds']
+                        config_check_cycles = max(1, round(60 / base_interval))
 
                 # Check for control signals
                 control_signal = self.check_control_signals()
@@ -1011,6 +1680,7 @@ class StreamMonitor:
                     reason = control_signal.split(":", 1)[1]
                     self.logger.info(f"🛑 Received stop signal: {reason}")
                     self.monitoring = False
+                    await self.settle_status_file()
                     self.update_status_file("stopping", f"Stop signal received: {reason}")
                     break
 
@@ -1023,51 +1693,63 @@ class StreamMonitor:
                     if self.pause_file.exists():
                         self.pause_file.unlink()
 
-                    await asyncio.sleep(duration)
+                    await self.wait_for_wakeup(duration)
                     self.logger.info("▶️  Resuming monitoring...")
                     self.update_status_file("monitoring", "Resumed after pause")
                     continue
 
                 check_count += 1
-                start_time = asyncio.get_event_loop().time()
+                start_time = time.monotonic()
 
-                enabled_streamers = {
-                    k: v for k, v in self.config['streamers'].items()
-                    if v.get('enabled', True)
-                }
-
-                self.logger.debug(f"🔄 Check cycle #{check_count} - Checking {len(enabled_streamers)} streamers in parallel...")
+                # Only check streamers whose backoff has expired
+                now = start_time
+                enabled_streamers = self.pop_due_streamers(now)
 
-                # Check all streamers in parallel
-                live_status = await self.check_all_streamers_parallel(enabled_streamers)
+                self.logger.debug("🔄 Check cycle #%s - Checking %s streamers in parallel...", check_count, len(enabled_streamers))
 
-                # Process results with ONLY stability checking (no additional verification)
+                # Check all streamers in parallel, processing results with ONLY
+                # stability checking (no additional verification) as they arrive,
+                # so a recording starts without waiting for the slowest check
+                live_status = {}
+                live_now = set()  # Filled as results arrive, no second pass over live_status
                 actions_taken = []
-                for username, is_live in live_status.items():
-                    # Use stability tracking to determine if action should be taken
-                    if self.track_stream_stability(username, is_live):
-                        current_recording = username in self.active_recordings
-
-                        if is_live and not current_recording:
-                            # Start recording
+                try:
+                    # Streamers being recorded have a known room, so they share one request
+                    recorded = [v['username'] for v in enabled_streamers.values() if v['username'] in self.active_recordings]
+                    if recorded:
+                        for username, is_live in (await self.check_recorded_rooms(recorded)).items():
+                            live_status[username] = is_live
+                            if is_live:
+                                live_now.add(username)
+                            self.track_stream_stability(username, is_live)
+                    remaining = {k: v for k, v in enabled_streamers.items() if v['username'] not in live_status}
+
+                    async for username, is_live in self.iter_streamer_status(remaining):
+                        live_status[username] = is_live
+                        if is_live:
+                            live_now.add(username)
+                        # Only confirms live streamers that aren't being recorded yet
+                        if self.track_stream_stability(username, is_live):
                             self.logger.info(f"🟢 {username} went LIVE! (stability confirmed)")
-                            asyncio.create_task(self.start_recording(username))
+                            self.spawn(self.start_recording(username))
                             actions_taken.append(f"{username}:LIVE")
+                finally:
+                    # Even an interrupted cycle must not drop streamers from the schedule
+                    self.schedule_next_checks(enabled_streamers, live_status, now)
 
-                        elif not is_live and current_recording:
-                            # REMOVED: No longer stop recordings based on polling
-                            # Event-based termination (LiveEndEvent/DisconnectEvent) handles this
-                            self.logger.debug(f"📊 {username} appears offline via polling, but relying on event-based termination")
-                            pass
+                # Polling no longer stops recordings; event-based termination
+                # (LiveEndEvent/DisconnectEvent) handles this
+                for username in self.active_recordings.keys() & (live_status.keys() - live_now):
+                    self.logger.debug("📊 %s appears offline via polling, but relying on event-based termination", username)
 
                 # Count results for summary
                 total_checked = len(live_status)
-                currently_live = [username for username, is_live in live_status.items() if is_live]
-                currently_recording = list(self.active_recordings.keys())
-                pending_disconnects = list(self.pending_disconnects.keys())
+                currently_live = sorted(live_now)
+                currently_recording = list(self.active_recordings)
+                pending_disconnects = list(self.pending_disconnects)
 
                 # Calculate check duration
-                check_duration = asyncio.get_event_loop().time() - start_time
+                check_duration = time.monotonic() - start_time
 
                 # Update status file
                 status_info = f"Check #{check_count}, duration: {check_duration:.1f}s"
@@ -1075,36 +1757,40 @@ class StreamMonitor:
                     status_info += f", pending disconnects: {len(pending_disconnects)}"
                 self.update_status_file("monitoring", status_info)
 
-                # Status update with cleaner output
-                status_msg_parts = [f"📊 Checked {total_checked} streamers"]
-                if config_changed:
-                    status_msg_parts.append("🔄 Config reloaded")
-                if currently_live:
-                    status_msg_parts.append(f"📺 Live: {', '.join(currently_live)}")
-                else:
-                    status_msg_parts.append("💤 None live")
-                if currently_recording:
-                    status_msg_parts.append(f"🎥 Recording: {', '.join(currently_recording)}")
-                if pending_disconnects:
-                    status_msg_parts.append(f"🔌 Pending disconnects: {', '.join(pending_disconnects)}")
-                status_msg_parts.append(f"⏱️ {check_duration:.1f}s")
-
-                # Show status based on activity
-                if actions_taken or config_changed or pending_disconnects or check_count % 5 == 0:
+                # Status update with cleaner output; the message is only built on cycles that log it
+                if actions_taken or config_changed or pending_disconnects or check_count % 20 == 0:
+                    status_msg_parts = [f"📊 Checked {total_checked} streamers"]
+                    if config_changed:
+                        status_msg_parts.append("🔄 Config reloaded")
+                    if currently_live:
+                        status_msg_parts.append(f"📺 Live: {', '.join(currently_live)}")
+                    else:
+                        status_msg_parts.append("💤 None live")
+                    if currently_recording:
+                        status_msg_parts.append(f"🎥 Recording: {', '.join(currently_recording)}")
+                    if pending_disconnects:
+                        status_msg_parts.append(f"🔌 Pending disconnects: {', '.join(pending_disconnects)}")
+                    status_msg_parts.append(f"⏱️ {check_duration:.1f}s")
                     self.logger.info(" | ".join(status_msg_parts))
                     if actions_taken:
-                        self.logger.info(f"🎬 Actions: {', '.join(actions_taken)}")
-                elif check_count % 20 == 0:  # Minimal status every 20 cycles
-                    self.logger.info(f"📊 Check #{check_count} | {total_checked} streamers | {len(currently_live)} live | {len(currently_recording)} recording | ⏱️ {check_duration:.1f}s")
+                        self.logger.info("🎬 Actions: %s", ', '.join(actions_taken))
+                elif check_count % 5 == 0:  # Minimal status every 5 cycles, full one every 20
+                    self.logger.info("📊 Check #%d | %d streamers | %d live | %d recording | ⏱️ %.1fs",
+                                     check_count, total_checked, len(currently_live), len(currently_recording), check_duration)
 
                 # Dynamic sleep adjustment based on check duration
-                base_interval = self.config['settings']['check_interval_seconds']
                 adjusted_interval = max(10, base_interval - check_duration)  # Minimum 10 seconds
 
-                if check_duration > base_interval * 0.8:  # If check takes more than 80% of interval
-                    self.logger.warning(f"⚠️  Check cycle took {check_duration:.1f}s (target: {base_interval}s)")
+                duration_ema = 0.2 * check_duration + 0.8 * duration_ema
+                if duration_ema > base_interval * 0.8 and not slow_warned:  # Checks take more than 80% of interval
+                    self.logger.warning(f"⚠️  Check cycles are taking {duration_ema:.1f}s on average "
+                                        f"(last {check_duration:.1f}s, target: {base_interval}s)")
+                    slow_warned = True
+                elif duration_ema < base_interval * 0.5 and slow_warned:
+                    self.logger.info(f"✅ Check cycles back to {duration_ema:.1f}s on average")
+                    slow_warned = False
 
-                await asyncio.sleep(adjusted_interval)
+                await self.wait_for_wakeup(adjusted_interval)
 
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}")
@@ -1112,36 +1798,52 @@ class StreamMonitor:
                 await asyncio.sleep(30)  # Wait longer on error
 
     def signal_handler(self, signum, frame):
-        """Handle shutdown signals"""
+        """Handle shutdown signals delivered through signal.signal (Windows)"""
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self.request_shutdown, signum)
+        else:
+            self.monitoring = False
+
+    def request_shutdown(self, signum):
+        """Stop the monitoring loop; run() then stops every active recording"""
         signal_name = signal.Signals(signum).name if hasattr(signal, 'Signals') else str(signum)
         self.logger.info(f"🛑 Received signal {signal_name} ({signum}). Shutting down...")
         self.monitoring = False
 
-        # Stop all active recordings and cancel pending disconnects
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                for username in list(self.active_recordings.keys()):
-                    loop.create_task(self.stop_recording(username, "shutdown"))
-
-                # Cancel pending disconnect confirmations
-                for username, pending_info in list(self.pending_disconnects.items()):
-                    try:
-                        pending_info['task'].cancel()
-                    except:
-                        pass
-                self.pending_disconnects.clear()
+            # Cancel pending disconnect confirmations
+            for username, pending_info in list(self.pending_disconnects.items()):
+                try:
+                    pending_info['task'].cancel()
+                except:
+                    pass
+            self.pending_disconnects.clear()
 
+            # Wake the loop from its sleep so shutdown starts right away
+            self.wake_up()
+            if self._monitor_task is not None:
+                self._monitor_task.cancel()
         except Exception as e:
             self.logger.error(f"Error handling signal: {e}")
 
     async def run(self):
         """Run the monitor"""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._monitor_task = asyncio.ensure_future(self.monitor_streamers())
+        self._flush_task = asyncio.ensure_future(self.flush_event_buffers())
+        self.setup_signal_handlers(self._loop)
+        self.watch_control_files(self._loop)
         try:
-            await self.monitor_streamers()
+            await self._monitor_task
+        except asyncio.CancelledError:
+            self.logger.info("🛑 Monitoring loop stopped")
         except KeyboardInterrupt:
             self.logger.info("👋 Monitor stopped by user (Ctrl+C)")
         finally:
+            # Let an in-flight status write land before the shutdown states are written
+            await self.settle_status_file()
+
             # Cleanup
             self.update_status_file("shutting_down", "Cleaning up active recordings")
 
@@ -1149,18 +1851,31 @@ class StreamMonitor:
             for username, pending_info in list(self.pending_disconnects.items()):
                 try:
                     pending_info['task'].cancel()
-                    self.logger.debug(f"Cancelled pending disconnect for {username}")
+                    self.logger.debug("Cancelled pending disconnect for %s", username)
                 except:
                     pass
             self.pending_disconnects.clear()
 
-            # Stop all active recordings
-            for username in list(self.active_recordings.keys()):
-                await self.stop_recording(username, "shutdown")
+            # A recording still starting would otherwise outlive the shutdown, and
+            # everything spawned must be done before the I/O executor goes away
+            for task in list(self._cancellable_tasks):
+                task.cancel()
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+            # Stop all active recordings; each one waits out its own disconnect,
+            # so they are stopped side by side
+            await self.stop_recordings(list(self.active_recordings.keys()), "shutdown")
+            self._flush_task.cancel()
+
+            await self.close_probe_clients()
+            self.stop_watching_control_files()
 
             # Clean up control files
             self.cleanup_control_files()
 
+            self._io_executor.shutdown(wait=True)
+            self._session_log_handle.close()
+
             # Final status update
             self.update_status_file("stopped", "Monitor shutdown complete")
             self.logger.info("🏁 Monitor shutdown complete")
@@ -1191,7 +1906,7 @@ Windows Examples:
 
     parser.add_argument(
         '--config', '-c',
-        type=str,
+        type=Path,
         default='streamers_config.json',
         help='Path to configuration file (default: streamers_config.json)'
     )
@@ -1222,6 +1937,37 @@ Windows Examples:
 
     return parser.parse_args()
 
+def run_with_loop_factory(coro, loop_factory):
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
+
+def select_event_loop() -> tuple:
+    """Use uvloop (or winloop on Windows) when installed; returns the loop's name and a function running a coroutine on it"""
+    if platform.system() == "Windows":
+        try:
+            import winloop as fast_loop
+            name = "winloop"
+        except ImportError:
+            try:
+                # Windows-specific event loop policy for better compatibility
+                asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+            except AttributeError:
+                # Fallback for older Python versions
+                pass
+            return "asyncio", asyncio.run
+    else:
+        try:
+            import uvloop as fast_loop
+            name = "uvloop"
+        except ImportError:
+            return "asyncio", asyncio.run
+
+    if sys.version_info >= (3, 11):
+        # A loop factory instead of install(), which is deprecated from Python 3.12
+        return name, functools.partial(run_with_loop_factory, loop_factory=fast_loop.new_event_loop)
+    fast_loop.install()
+    return name, asyncio.run
+
 def main():
     """Main entry point"""
     args = parse_args()
@@ -1244,31 +1990,36 @@ def main():
         except:
             pass
 
-    print("🚀 TikTok Live Stream Monitor Starting...")
-    print(f"🖥️  Platform: {platform.system()} {platform.release()}")
-    print(f"📁 Configuration file: {args.config}")
+    # The startup banner goes out in a single write
+    banner = [
+        "🚀 TikTok Live Stream Monitor Starting...",
+        f"🖥️  Platform: {platform.system()} {platform.release()}",
+        f"📁 Configuration file: {args.config}",
+    ]
 
     if args.session_id:
-        print("🔑 Session ID provided via command line")
+        banner.append("🔑 Session ID provided via command line")
     if args.data_center:
-        print(f"🌍 Data center: {args.data_center}")
+        banner.append(f"🌍 Data center: {args.data_center}")
     if args.verbose:
-        print("📝 Verbose logging enabled")
-
-    print("📊 Session logs will be saved to: monitoring_sessions_[date].csv")
-    print("📝 Debug logs will be saved to: monitor_[date].log")
-    print("📄 Control options:")
-    print("   • Create 'stop_monitor.txt' to stop monitoring gracefully")
-    print("   • Create 'pause_monitor.txt' to pause monitoring temporarily")
-    print("   • Check 'monitor_status.txt' for current status")
-    print("   • Edit config file to modify streamers (auto-reloads)")
+        banner.append("📝 Verbose logging enabled")
+
+    banner += [
+        "📊 Session logs will be saved to: monitoring_sessions_[date].csv",
+        "📝 Debug logs will be saved to: monitor_[date].log",
+        "📄 Control options:",
+        "   • Create 'stop_monitor.txt' to stop monitoring gracefully",
+        "   • Create 'pause_monitor.txt' to pause monitoring temporarily",
+        "   • Check 'monitor_status.txt' for current status",
+        "   • Edit config file to modify streamers (auto-reloads)",
+    ]
 
     if platform.system() == "Windows":
-        print("⏹️  Press Ctrl+C or Ctrl+Break for immediate stop")
-        print("💡 Windows users: Use 'py -3' instead of 'python3' if needed")
+        banner.append("⏹️  Press Ctrl+C or Ctrl+Break for immediate stop")
+        banner.append("💡 Windows users: Use 'py -3' instead of 'python3' if needed")
     else:
-        print("⏹️  Press Ctrl+C for immediate stop")
-    print()
+        banner.append("⏹️  Press Ctrl+C for immediate stop")
+    print("\n".join(banner) + "\n", flush=True)
 
     # Create monitor with command line arguments
     try:
@@ -1288,6 +2039,7 @@ def main():
     # Apply command line overrides
     if args.data_center:
         monitor.config['settings']['tt_target_idc'] = args.data_center
+        monitor.rebuild_caches()
         monitor.logger.info(f"🌍 Data center overridden to: {args.data_center}")
 
     if args.check_interval:
@@ -1306,15 +2058,10 @@ def main():
         monitor.logger.info("📝 Verbose logging enabled")
 
     try:
-        if platform.system() == "Windows":
-            # Windows-specific event loop policy for better compatibility
-            try:
-                asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-            except AttributeError:
-                # Fallback for older Python versions
-                pass
+        event_loop, run_event_loop = select_event_loop()
+        monitor.logger.info(f"⚙️  Event loop: {event_loop}")
 
-        asyncio.run(monitor.run())
+        run_event_loop(monitor.run())
     except KeyboardInterrupt:
         print("\n👋 Monitor stopped by user")
     except Exception as e: